@@ -16,6 +16,7 @@ from maheu_group_project.heuristics.solver import SolverType, solve_deterministi
 from maheu_group_project.solution.metrics import get_pretty_metrics
 from maheu_group_project.solution.verifying import verify_solution
 from maheu_group_project.solution.evaluate import objective_function
+from maheu_group_project import parsing
 
 # This is the default configuration of the script. It can be overridden by command line arguments.
 SOLVERS: list[SolverType] = [SolverType.FLOW]#SolverType.GREEDY, SolverType.GREEDY_CANDIDATE_PATHS]#, SolverType.FLOW]
@@ -79,8 +80,8 @@ def run_on_all_data_from_first_dataset():
                         quantile=QUANTILE_VALUE,
                     )
 
-                # Verify the solution
-                is_valid = verify_solution(vehicles, vehicle_assignments, trucks_realised, truck_assignments)
+                # Verify the solution. The number of vehicles that did not arrive is written to the results below.
+                is_valid = verify_solution(vehicles, vehicle_assignments, trucks_realised, truck_assignments, quiet=True)
                 number_of_vehicles_that_did_not_arrived = 0
                 match is_valid:
                     case bool():
@@ -137,6 +138,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--deterministic', type=str, choices=['true', 'false', 'TRUE', 'FALSE'], default=None, help='Use deterministic mode (true/false)')
     parser.add_argument('--dataset_indices', nargs='+', type=int, default=None, help='List of dataset indices to use')
     parser.add_argument('--quantile_value', type=float, default=None, help='Quantile value to use for the solver')
+    parser.add_argument('--disk-cache', action='store_true',
+                        help='Cache the parsed datasets on disk between runs, see parsing.USE_DISK_CACHE')
     return parser.parse_args()
 
 def run_all_for_quantiles():
@@ -153,6 +156,8 @@ def run_all_for_quantiles():
         DATASET_INDICES = args.dataset_indices
     if args.quantile_value is not None:
         QUANTILE_VALUE = args.quantile_value
+    if args.disk_cache:
+        parsing.USE_DISK_CACHE = True
 
     # Run run_on_all_data_from_first_dataset for all quantile values from 0.0 to 1.0 in steps of 0.05
     #for i in [0.0, 0.05, 0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.55, 0.6, 0.65, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95, 1.0]:
@@ -1,6 +1,6 @@
 from datetime import date, timedelta
 
-from maheu_group_project.solution.encoding import TruckIdentifier, Truck, Vehicle
+from maheu_group_project.solution.encoding import TruckIdentifier, Truck, Vehicle, Location, LocationType
 
 
 def get_first_last_and_days(vehicles: list[Vehicle], trucks: dict[TruckIdentifier, Truck]) -> tuple[date, date, list[date]]:
@@ -46,3 +46,54 @@ def convert_trucks_to_dict_by_day(trucks: dict[TruckIdentifier, Truck]) -> dict[
             truck_dict_by_day[truck.departure_date] = {}
         truck_dict_by_day[truck.departure_date][truck.get_identifier()] = truck
     return truck_dict_by_day
+
+
+def find_unreachable_vehicles(vehicles: list[Vehicle], trucks: dict[TruckIdentifier, Truck]) -> list[int]:
+    """
+    Returns the ids of those vehicles which cannot reach their destination using the given trucks, no matter how late.
+
+    A vehicle can reach its destination if there is a sequence of trucks starting at the origin of the vehicle no
+    earlier than its available date, where each truck departs at least one day after the previous one arrives, due to
+    the obligatory rest day. As in the flow network, there is no rest day at DEALER locations, so there a truck may
+    depart on the day the previous one arrives. Capacities are ignored, so this is only a necessary condition for a
+    feasible assignment.
+
+    Args:
+        vehicles (list[Vehicle]): List of vehicles to check.
+        trucks (dict[TruckIdentifier, Truck]): Dictionary of trucks available for transportation.
+
+    Returns:
+        list[int]: The ids of the vehicles which cannot reach their destination, in the order of the given vehicles.
+    """
+    sorted_trucks = sorted(trucks.values(), key=lambda truck: truck.departure_date)
+
+    # Vehicles starting at the same location on the same day can reach the same locations, so we only compute the
+    # earliest day on which a vehicle can depart from each location once for each of these pairs
+    earliest_departures_by_start: dict[tuple[Location, date], dict[Location, date]] = {}
+    unreachable_vehicles = []
+    for vehicle in vehicles:
+        start = (vehicle.origin, vehicle.available_date)
+        earliest_departures = earliest_departures_by_start.get(start)
+        if earliest_departures is None:
+            earliest_departures = {vehicle.origin: vehicle.available_date}
+            # Trucks arriving at a DEALER on the day they depart may enable trucks which were already considered, so we
+            # repeat the pass over the trucks until no earliest departure improves anymore
+            improved = True
+            while improved:
+                improved = False
+                for truck in sorted_trucks:
+                    departure_possible_from = earliest_departures.get(truck.start_location)
+                    if departure_possible_from is not None and departure_possible_from <= truck.departure_date:
+                        # The vehicle has to rest for one day before it can depart again, except at DEALER locations
+                        next_departure_possible_from = truck.arrival_date
+                        if truck.end_location.type != LocationType.DEALER:
+                            next_departure_possible_from += timedelta(days=1)
+                        current_departure = earliest_departures.get(truck.end_location)
+                        if current_departure is None or next_departure_possible_from < current_departure:
+                            earliest_departures[truck.end_location] = next_departure_possible_from
+                            improved = True
+            earliest_departures_by_start[start] = earliest_departures
+        if vehicle.destination not in earliest_departures:
+            unreachable_vehicles.append(vehicle.id)
+
+    return unreachable_vehicles
@@ -2,9 +2,6 @@ import hashlib
 import datetime
 import networkx as nx
 
-from matplotlib import pyplot as plt
-from matplotlib import lines
-from matplotlib.patches import FancyArrowPatch
 from networkx import MultiDiGraph
 
 from maheu_group_project.heuristics.flow.types import dealership_to_commodity_group, NodeType, NodeIdentifier
@@ -37,6 +34,11 @@ def visualize_flow_network(flow_network: MultiDiGraph, locations: list[Location]
         flow (dict[NodeIdentifier, dict[NodeIdentifier, dict[int, int]]], optional): Flow data for each edge.
         only_show_flow_nodes (bool): If True, only nodes involved in the flow will be shown.
     """
+    # Imported here, since matplotlib is slow to import and this module is imported by the solvers
+    from matplotlib import pyplot as plt
+    from matplotlib import lines
+    from matplotlib.patches import FancyArrowPatch
+
     # Ensure correct type for flow_network
     flow_network: MultiDiGraph[NodeIdentifier] = flow_network
 
@@ -1,9 +1,6 @@
 import networkx as nx
 from networkx import MultiDiGraph
 import statistics
-from matplotlib.patches import FancyArrowPatch
-import matplotlib.pyplot as plt
-import numpy as np
 import heapq
 from itertools import count
 from maheu_group_project.solution.encoding import TruckIdentifier, Truck, Location, LocationType
@@ -197,6 +194,11 @@ def shortest_paths(network: MultiDiGraph, start_location: Location, end_location
 
 
 def visualize_logistics_network(network: MultiDiGraph):
+    # Imported here, since matplotlib is slow to import and only needed for debugging
+    from matplotlib.patches import FancyArrowPatch
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     # Assign fixed x positions per node type
     x_pos_map = {
         'PLANT': 0,
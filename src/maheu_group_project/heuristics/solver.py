@@ -1,29 +1,27 @@
+import copy
+import functools
+import os
 import time
-from enum import Enum
-
-from maheu_group_project.heuristics.flow.solve_deterministically import solve_flow_deterministically, \
-    solve_flow_as_mip_deterministically
-from maheu_group_project.heuristics.flow.network import create_flow_network
-from maheu_group_project.heuristics.flow.solve_in_real_time import solve_flow_in_real_time
-from maheu_group_project.heuristics.greedy.candidate_paths_calculator import create_logistics_network, \
-    calculate_candidate_paths
-from maheu_group_project.heuristics.greedy.greedy_candidate_paths import greedy_candidate_path_solver
-from maheu_group_project.heuristics.old_flow.old_solve import old_solve_as_flow
-from maheu_group_project.heuristics.greedy.greedy import greedy_solver
-from maheu_group_project.lower_bounds.flow.uncapacitated_flow import lower_bound_uncapacitated_flow
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from enum import IntEnum
+from typing import Callable, Iterable, NamedTuple
+
+from maheu_group_project.heuristics.common import find_unreachable_vehicles
 from maheu_group_project.parsing import read_data, get_shortest_paths
 from maheu_group_project.solution.encoding import VehicleAssignment, TruckIdentifier, TruckAssignment, Vehicle, Truck, \
     Location
-from maheu_group_project.uncertainty.adjust_planned import assign_quantile_based_planned_capacities
 
 
-class SolverType(Enum):
+class SolverType(IntEnum):
     """
     Enum to represent the type of solver used in the optimization process.
 
 
     FLOW: A solver that uses a flow-based approach to optimize the assignment of vehicles to trucks. \n
     GREEDY: A solver that uses a greedy algorithm to assign vehicles to trucks based on the cheapest available options.
+
+    The values are consecutive, starting at 0, since they are used as indices into the dispatch tables of the solvers.
     """
     FLOW = 0
     GREEDY = 1
@@ -39,6 +37,383 @@ class SolverType(Enum):
         return self.name
 
 
+class SolveResult(NamedTuple):
+    """
+    The result of running a solver, together with the data it was run on.
+
+    Attributes:
+        vehicle_assignments (list[VehicleAssignment]): List of vehicle assignments.
+        truck_assignments (dict[TruckIdentifier, TruckAssignment]): Dictionary mapping truck identifiers to their
+            assignments.
+        locations (list[Location]): List of unique locations.
+        vehicles (list[Vehicle]): List of vehicles with their details.
+        trucks_realised (dict[TruckIdentifier, Truck]): Dictionary mapping truck identifiers to Truck objects with
+            realised capacity data.
+        trucks_planned (dict[TruckIdentifier, Truck]): Dictionary mapping truck identifiers to Truck objects with
+            planned capacity data.
+        solve_time (float): The time taken to solve the problem in seconds.
+    """
+    vehicle_assignments: list[VehicleAssignment]
+    truck_assignments: dict[TruckIdentifier, TruckAssignment]
+    locations: list[Location]
+    vehicles: list[Vehicle]
+    trucks_realised: dict[TruckIdentifier, Truck]
+    trucks_planned: dict[TruckIdentifier, Truck]
+    solve_time: float
+
+
+@functools.lru_cache(maxsize=8)
+def _read_data_cached(dataset_dir_name: str, realised_capacity_file_name: str) -> \
+        tuple[list[Location], list[Vehicle], dict[TruckIdentifier, Truck], dict[TruckIdentifier, Truck]]:
+    """
+    Memoized version of `read_data`. The returned objects are shared between all callers and must not be mutated,
+    use `_read_data` to obtain a private copy.
+    """
+    return read_data(dataset_dir_name, realised_capacity_file_name)
+
+
+def _copy_data(data: tuple[list[Location], list[Vehicle], dict[TruckIdentifier, Truck], dict[TruckIdentifier, Truck]]) \
+        -> tuple[list[Location], list[Vehicle], dict[TruckIdentifier, Truck], dict[TruckIdentifier, Truck]]:
+    """
+    Returns a private copy of the given parsed dataset.
+
+    The vehicles and trucks are copied, since some solvers (and the adjustment of the planned capacities) modify them.
+    Locations are immutable and therefore shared.
+    """
+    locations, vehicles, trucks_realised, trucks_planned = data
+    return (list(locations),
+            [copy.copy(vehicle) for vehicle in vehicles],
+            {truck_id: copy.copy(truck) for truck_id, truck in trucks_realised.items()},
+            {truck_id: copy.copy(truck) for truck_id, truck in trucks_planned.items()})
+
+
+def _read_data(dataset_dir_name: str, realised_capacity_file_name: str) -> \
+        tuple[list[Location], list[Vehicle], dict[TruckIdentifier, Truck], dict[TruckIdentifier, Truck]]:
+    """
+    Returns the same data as `read_data`, but only parses the dataset files on the first call for a given dataset.
+    The returned data is a private copy, see `_copy_data`.
+    """
+    return _copy_data(_read_data_cached(dataset_dir_name, realised_capacity_file_name))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_shortest_paths_cached(dataset_dir_name: str, locations: tuple[Location, ...]) -> \
+        dict[tuple[Location, Location], list[Location]]:
+    """
+    Memoized version of `get_shortest_paths`. The returned dictionary is shared between all callers and must not be
+    mutated.
+    """
+    return get_shortest_paths(dataset_dir_name, list(locations))
+
+
+@dataclass
+class SolverContext:
+    """
+    Bundles the data a solver is run on, so that the solver runners below share a single signature.
+
+    Attributes:
+        dataset_dir_name (str): The name of the directory containing the dataset files.
+        locations (list[Location]): List of unique locations.
+        vehicles (list[Vehicle]): List of vehicles with their details.
+        trucks_realised (dict[TruckIdentifier, Truck]): Trucks with realised capacity data.
+        trucks_planned (dict[TruckIdentifier, Truck]): Trucks with planned capacity data.
+        start_time (float): The value of `time.perf_counter` when the solver started, set by the runner via
+            `start_timer`.
+    """
+    dataset_dir_name: str
+    locations: list[Location]
+    vehicles: list[Vehicle]
+    trucks_realised: dict[TruckIdentifier, Truck]
+    trucks_planned: dict[TruckIdentifier, Truck]
+    start_time: float = 0.0
+
+    def start_timer(self):
+        """
+        Starts the timer measuring the solve time. Runners call this after importing their solver backend, so that the
+        import time is not counted as solve time.
+        """
+        self.start_time = time.perf_counter()
+
+
+SolverRunner = Callable[[SolverContext], tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]]
+
+
+def _solve_for_reachable_vehicles(context: SolverContext, trucks: dict[TruckIdentifier, Truck],
+                                  solve: Callable[[list[Vehicle]], tuple[
+                                      list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]]) -> \
+        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+    """
+    Runs the given solve function only on those vehicles of the context which can reach their destination with the
+    given trucks, see `find_unreachable_vehicles`. The vehicles which cannot reach their destination are assigned no
+    trucks at all, so they do not make the flow problems infeasible and do not enlarge the flow networks.
+
+    The solvers index the list of vehicles by vehicle id, so the reachable vehicles are passed to the solve function
+    with consecutive ids, which are mapped back to the original ones in the returned assignments.
+
+    Args:
+        context (SolverContext): The data to run the solver on.
+        trucks (dict[TruckIdentifier, Truck]): The trucks the solver plans with.
+        solve (Callable[[list[Vehicle]], tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]]):
+            Function solving the problem for the given list of vehicles.
+
+    Returns:
+        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]: The vehicle assignments of all vehicles
+            of the context, ordered by vehicle id, and the truck assignments.
+    """
+    unreachable_vehicle_ids = set(find_unreachable_vehicles(context.vehicles, trucks))
+    if not unreachable_vehicle_ids:
+        return solve(context.vehicles)
+
+    unreachable_vehicle_assignments = [VehicleAssignment(id=vehicle_id)
+                                       for vehicle_id in sorted(unreachable_vehicle_ids)]
+    reachable_vehicles = [vehicle for vehicle in context.vehicles if vehicle.id not in unreachable_vehicle_ids]
+    if not reachable_vehicles:
+        return unreachable_vehicle_assignments, {truck_id: TruckAssignment() for truck_id in context.trucks_realised}
+
+    original_ids = [vehicle.id for vehicle in reachable_vehicles]
+    vehicle_assignments, truck_assignments = solve(
+        [replace(vehicle, id=new_id) for new_id, vehicle in enumerate(reachable_vehicles)])
+    for vehicle_assignment in vehicle_assignments:
+        vehicle_assignment.id = original_ids[vehicle_assignment.id]
+    for truck_assignment in truck_assignments.values():
+        truck_assignment.load = [original_ids[vehicle_id] for vehicle_id in truck_assignment.load]
+    vehicle_assignments.extend(unreachable_vehicle_assignments)
+    vehicle_assignments.sort(key=lambda vehicle_assignment: vehicle_assignment.id)
+    return vehicle_assignments, truck_assignments
+
+
+def _run_flow_deterministically(context: SolverContext, solve_as_mip: bool = False) -> \
+        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+    """
+    Runs the flow solver on the realised trucks. The flow network is built the same way for both ways of solving it.
+    """
+    from maheu_group_project.heuristics.flow.network import create_flow_network
+    from maheu_group_project.heuristics.flow.solve_deterministically import solve_flow_deterministically, \
+        solve_flow_as_mip_deterministically
+    context.start_timer()
+
+    def solve(vehicles: list[Vehicle]) -> tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+        flow_network, commodity_groups = create_flow_network(vehicles, context.trucks_realised, context.locations)
+        if solve_as_mip:
+            return solve_flow_as_mip_deterministically(flow_network, commodity_groups, vehicles,
+                                                       context.trucks_realised, context.locations)
+        return solve_flow_deterministically(flow_network, commodity_groups, context.locations, vehicles,
+                                            context.trucks_realised)
+
+    return _solve_for_reachable_vehicles(context, context.trucks_realised, solve)
+
+
+def _run_greedy_deterministically(context: SolverContext) -> \
+        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+    """
+    Runs the greedy solver on the realised trucks.
+    """
+    from maheu_group_project.heuristics.greedy.greedy import greedy_solver
+    context.start_timer()
+    shortest_paths = _get_shortest_paths_cached(context.dataset_dir_name, tuple(context.locations))
+    return _solve_for_reachable_vehicles(
+        context, context.trucks_realised,
+        lambda vehicles: greedy_solver(vehicles, context.trucks_realised, context.trucks_realised, shortest_paths))
+
+
+def _run_old_flow_deterministically(context: SolverContext) -> \
+        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+    """
+    Runs the old flow solver on the realised trucks.
+    """
+    from maheu_group_project.heuristics.old_flow.old_solve import old_solve_as_flow
+    context.start_timer()
+    return old_solve_as_flow(context.vehicles, context.trucks_realised, context.locations)
+
+
+def _run_lower_bound_uncapacitated_flow(context: SolverContext) -> \
+        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+    """
+    Computes the lower bound by solving the uncapacitated flow problem.
+    """
+    from maheu_group_project.lower_bounds.flow.uncapacitated_flow import lower_bound_uncapacitated_flow
+    context.start_timer()
+
+    def solve(vehicles: list[Vehicle]) -> tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+        # The lower bound works on trucks with adjusted capacities, which are the ones the solution has to be evaluated
+        # on
+        vehicle_assignments, truck_assignments, context.trucks_realised = lower_bound_uncapacitated_flow(
+            context.locations, vehicles, context.trucks_realised)
+        return vehicle_assignments, truck_assignments
+
+    return _solve_for_reachable_vehicles(context, context.trucks_realised, solve)
+
+
+def _run_greedy_candidate_paths_deterministically(context: SolverContext) -> \
+        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+    """
+    Runs the greedy candidate paths solver on the realised trucks.
+    """
+    from maheu_group_project.heuristics.greedy.candidate_paths_calculator import create_logistics_network, \
+        calculate_candidate_paths
+    from maheu_group_project.heuristics.greedy.greedy_candidate_paths import greedy_candidate_path_solver
+    context.start_timer()
+    logistics_network = create_logistics_network(context.locations, context.trucks_realised)
+    candidate_paths = calculate_candidate_paths(logistics_network)
+    return greedy_candidate_path_solver(context.vehicles, context.trucks_realised, context.locations,
+                                        context.trucks_realised, candidate_paths)
+
+
+def _run_flow_mip_deterministically(context: SolverContext) -> \
+        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+    """
+    Runs the flow solver on the realised trucks, solving the flow problem as a MIP.
+    """
+    return _run_flow_deterministically(context, solve_as_mip=True)
+
+
+def _run_flow_in_real_time(context: SolverContext, solve_as_mip: bool = False) -> \
+        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+    """
+    Runs the flow solver in real-time, planning on the planned trucks.
+    """
+    from maheu_group_project.heuristics.flow.network import create_flow_network
+    from maheu_group_project.heuristics.flow.solve_in_real_time import solve_flow_in_real_time
+    context.start_timer()
+
+    def solve(vehicles: list[Vehicle]) -> tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+        flow_network, commodity_groups = create_flow_network(vehicles, context.trucks_planned, context.locations)
+        return solve_flow_in_real_time(flow_network, commodity_groups, context.locations, vehicles,
+                                       context.trucks_planned, context.trucks_realised, solve_as_mip)
+
+    # In real-time, only the planned trucks are known in advance
+    return _solve_for_reachable_vehicles(context, context.trucks_planned, solve)
+
+
+def _run_flow_mip_in_real_time(context: SolverContext) -> \
+        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+    """
+    Runs the flow solver in real-time, solving the flow problems as MIPs.
+    """
+    return _run_flow_in_real_time(context, solve_as_mip=True)
+
+
+def _run_greedy_in_real_time(context: SolverContext) -> \
+        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+    """
+    Runs the greedy solver in real-time, planning on the planned trucks.
+    """
+    from maheu_group_project.heuristics.greedy.greedy import greedy_solver
+    context.start_timer()
+    shortest_paths = _get_shortest_paths_cached(context.dataset_dir_name, tuple(context.locations))
+    # In real-time, only the planned trucks are known in advance
+    return _solve_for_reachable_vehicles(
+        context, context.trucks_planned,
+        lambda vehicles: greedy_solver(vehicles, context.trucks_planned, context.trucks_realised, shortest_paths))
+
+
+def _run_greedy_candidate_paths_in_real_time(context: SolverContext) -> \
+        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
+    """
+    Runs the greedy candidate paths solver in real-time, planning on the planned trucks.
+    """
+    from maheu_group_project.heuristics.greedy.candidate_paths_calculator import create_logistics_network, \
+        calculate_candidate_paths
+    from maheu_group_project.heuristics.greedy.greedy_candidate_paths import greedy_candidate_path_solver
+    context.start_timer()
+    logistics_network = create_logistics_network(context.locations, context.trucks_realised)
+    candidate_paths = calculate_candidate_paths(logistics_network)
+    return greedy_candidate_path_solver(context.vehicles, context.trucks_planned, context.locations,
+                                        context.trucks_realised, candidate_paths)
+
+
+def _create_dispatch_table(solvers: dict[SolverType, SolverRunner]) -> tuple[SolverRunner | None, ...]:
+    """
+    Converts a mapping from solver types to their runners into a tuple which can be indexed by the solver types directly.
+    Solver types without a runner are mapped to None.
+    """
+    dispatch_table: list[SolverRunner | None] = [None] * len(SolverType)
+    for solver_type, runner in solvers.items():
+        dispatch_table[solver_type] = runner
+    return tuple(dispatch_table)
+
+
+def _get_runner(dispatch_table: tuple[SolverRunner | None, ...], solver_type: SolverType) -> SolverRunner | None:
+    """
+    Returns the runner for the given solver type from the given dispatch table, or None if there is none.
+    """
+    if not isinstance(solver_type, SolverType):
+        return None
+    return dispatch_table[solver_type]
+
+
+# Dispatch tables mapping each solver type to the function running it
+_DETERMINISTIC_SOLVERS = _create_dispatch_table({
+    SolverType.FLOW: _run_flow_deterministically,
+    SolverType.GREEDY: _run_greedy_deterministically,
+    SolverType.OLD_FLOW: _run_old_flow_deterministically,
+    SolverType.LOWER_BOUND_UNCAPACITATED_FLOW: _run_lower_bound_uncapacitated_flow,
+    SolverType.GREEDY_CANDIDATE_PATHS: _run_greedy_candidate_paths_deterministically,
+    SolverType.FLOW_MIP: _run_flow_mip_deterministically,
+})
+_REAL_TIME_SOLVERS = _create_dispatch_table({
+    SolverType.FLOW: _run_flow_in_real_time,
+    SolverType.FLOW_MIP: _run_flow_mip_in_real_time,
+    SolverType.GREEDY: _run_greedy_in_real_time,
+    SolverType.GREEDY_CANDIDATE_PATHS: _run_greedy_candidate_paths_in_real_time,
+})
+
+
+def _solve(runner: SolverRunner, context: SolverContext) -> SolveResult:
+    """
+    Runs the given solver runner on the given context and packages its assignments together with the (possibly
+    updated) data of the context and the time taken to solve.
+
+    Args:
+        runner (SolverRunner): The runner of the solver to use, taken from one of the dispatch tables.
+        context (SolverContext): The data to run the solver on.
+
+    Returns:
+        SolveResult: The vehicle and truck assignments together with the data they were computed on and the time taken
+            to solve the problem in seconds.
+    """
+    vehicle_assignments, truck_assignments = runner(context)
+    end_time = time.perf_counter() - context.start_time
+    return SolveResult(vehicle_assignments, truck_assignments, context.locations, context.vehicles,
+                       context.trucks_realised, context.trucks_planned, end_time)
+
+
+def _solve_deterministically_on_data(solver_type: SolverType, dataset_dir_name: str,
+                                     data: tuple[list[Location], list[Vehicle], dict[TruckIdentifier, Truck],
+                                                 dict[TruckIdentifier, Truck]]) -> SolveResult:
+    """
+    Same as `solve_deterministically_and_return_data`, but runs on already parsed data, which may be modified.
+    """
+    runner = _get_runner(_DETERMINISTIC_SOLVERS, solver_type)
+    if runner is None:
+        raise ValueError(f"Unknown solver type: {solver_type}")
+
+    context = SolverContext(dataset_dir_name, *data)
+    return _solve(runner, context)
+
+
+def _solve_real_time_on_data(solver_type: SolverType, dataset_dir_name: str,
+                             data: tuple[list[Location], list[Vehicle], dict[TruckIdentifier, Truck],
+                                         dict[TruckIdentifier, Truck]], quantile: float) -> SolveResult:
+    """
+    Same as `solve_real_time_and_return_data`, but runs on already parsed data, which may be modified.
+    """
+    runner = _get_runner(_REAL_TIME_SOLVERS, solver_type)
+    if runner is None:
+        raise ValueError(f"This solver type is not supported: {solver_type}")
+
+    locations, vehicles, trucks_realised, trucks_planned = data
+
+    if quantile != 0.0:
+        from maheu_group_project.uncertainty.adjust_planned import assign_quantile_based_planned_capacities
+
+        print(f"Adjusting planned truck capacities with quantile: {quantile}")
+        trucks_planned = assign_quantile_based_planned_capacities(trucks_planned, dataset_dir_name, quantile)
+
+    context = SolverContext(dataset_dir_name, locations, vehicles, trucks_realised, trucks_planned)
+    return _solve(runner, context)
+
+
 def solve_deterministically(solver_type: SolverType, dataset_dir_name: str, realised_capacity_file_name: str) -> \
         tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
     """
@@ -55,15 +430,12 @@ def solve_deterministically(solver_type: SolverType, dataset_dir_name: str, real
             - list[VehicleAssignment]: List of vehicle assignments.
             - dict[TruckIdentifier, TruckAssignment]: Dictionary mapping truck identifiers to their assignments.
     """
-    vehicle_assignments, truck_assignments, _, _, _, _, _ = solve_deterministically_and_return_data(
-        solver_type, dataset_dir_name, realised_capacity_file_name)
-    return vehicle_assignments, truck_assignments
+    result = solve_deterministically_and_return_data(solver_type, dataset_dir_name, realised_capacity_file_name)
+    return result.vehicle_assignments, result.truck_assignments
 
 
 def solve_deterministically_and_return_data(solver_type: SolverType, dataset_dir_name: str,
-                                            realised_capacity_file_name: str) -> \
-        tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment], list[Location], list[Vehicle], dict[
-            TruckIdentifier, Truck], dict[TruckIdentifier, Truck], float]:
+                                            realised_capacity_file_name: str) -> SolveResult:
     """
     Solves the vehicle assignment problem deterministically (directly using the realized data) using the specified
     solver type and dataset, and returns additional data.
@@ -74,68 +446,43 @@ def solve_deterministically_and_return_data(solver_type: SolverType, dataset_dir
         realised_capacity_file_name (str): The name of the CSV file containing truck capacity data.
 
     Returns:
-        tuple: A tuple containing:
-            - list[VehicleAssignment]: List of vehicle assignments.
-            - dict[TruckIdentifier, TruckAssignment]: Dictionary mapping truck identifiers to their assignments.
-            - list[Location]: List of unique locations.
-            - list[Vehicle]: List of vehicles with their details.
-            - dict[TruckIdentifier, Truck]: Dictionary mapping truck identifiers to Truck objects with realised capacity data.
-            - dict[TruckIdentifier, Truck]: Dictionary mapping truck identifiers to Truck objects with planned capacity data.
-            - float: The time taken to solve the problem in seconds.
-    """
-    locations, vehicles, trucks_realised, trucks_planned = read_data(dataset_dir_name, realised_capacity_file_name)
-
-    # Start timer
-    start_time = time.time()
-
-    match solver_type:
-        case SolverType.FLOW:
-            flow_network, commodity_groups = create_flow_network(vehicles=vehicles, trucks=trucks_realised,
-                                                                 locations=locations)
-            vehicle_assignments, truck_assignments = solve_flow_deterministically(flow_network=flow_network,
-                                                                                  commodity_groups=commodity_groups,
-                                                                                  locations=locations,
-                                                                                  vehicles=vehicles,
-                                                                                  trucks=trucks_realised)
-            end_time = time.time() - start_time
-            return vehicle_assignments, truck_assignments, locations, vehicles, trucks_realised, trucks_planned, end_time
-        case SolverType.GREEDY:
-            shortest_paths = get_shortest_paths(dataset_dir_name, locations)
-            vehicle_assignments, truck_assignments = greedy_solver(vehicles, trucks_realised, trucks_realised,
-                                                                   shortest_paths)
-            end_time = time.time() - start_time
-            return vehicle_assignments, truck_assignments, locations, vehicles, trucks_realised, trucks_planned, end_time
-        case SolverType.OLD_FLOW:
-            vehicle_assignments, truck_assignments = old_solve_as_flow(vehicles, trucks_realised, locations)
-            end_time = time.time() - start_time
-            return vehicle_assignments, truck_assignments, locations, vehicles, trucks_realised, trucks_planned, end_time
-        case SolverType.LOWER_BOUND_UNCAPACITATED_FLOW:
-            vehicle_assignments, truck_assignments, trucks_realised = lower_bound_uncapacitated_flow(dataset_dir_name,
-                                                                                                     realised_capacity_file_name)
-            end_time = time.time() - start_time
-            return vehicle_assignments, truck_assignments, locations, vehicles, trucks_realised, trucks_planned, end_time
-        case SolverType.GREEDY_CANDIDATE_PATHS:
-            logistics_network = create_logistics_network(locations, trucks_realised)
-            candidate_paths = calculate_candidate_paths(logistics_network)
-            vehicle_assignments, truck_assignments = greedy_candidate_path_solver(vehicles, trucks_realised, locations,
-                                                                                  trucks_realised, candidate_paths)
-            end_time = time.time() - start_time
-            return vehicle_assignments, truck_assignments, locations, vehicles, trucks_realised, trucks_planned, end_time
-        case SolverType.FLOW_MIP:
-            flow_network, commodity_groups = create_flow_network(vehicles=vehicles, trucks=trucks_realised,
-                                                                 locations=locations)
-            vehicle_assignments, truck_assignments = solve_flow_as_mip_deterministically(flow_network=flow_network,
-                                                                                         commodity_groups=commodity_groups,
-                                                                                         vehicles=vehicles,
-                                                                                         trucks=trucks_realised,
-                                                                                         locations=locations)
-            end_time = time.time() - start_time
-            return vehicle_assignments, truck_assignments, locations, vehicles, trucks_realised, trucks_planned, end_time
-        case _:
-            raise ValueError(f"Unknown solver type: {solver_type}")
-
-
-def solve_real_time(solver_type: SolverType, dataset_dir_name: str, realised_capacity_file_name: str) -> \
+        SolveResult: The vehicle and truck assignments together with the data they were computed on and the time taken
+            to solve the problem in seconds.
+    """
+    return _solve_deterministically_on_data(solver_type, dataset_dir_name,
+                                            _read_data(dataset_dir_name, realised_capacity_file_name))
+
+
+def solve_deterministically_with_data(solver_type: SolverType, dataset_dir_name: str, locations: list[Location],
+                                      vehicles: list[Vehicle], trucks_realised: dict[TruckIdentifier, Truck],
+                                      trucks_planned: dict[TruckIdentifier, Truck]) -> SolveResult:
+    """
+    Same as `solve_deterministically_and_return_data`, but runs on already parsed data instead of reading the dataset
+    files, e.g. the data of a previous `SolveResult`.
+
+    The solver runs on a copy of the given data, so the given vehicles and trucks are not modified.
+
+    Args:
+        solver_type (SolverType): The type of solver to use.
+        dataset_dir_name (str): The name of the directory containing the dataset files. Only used by solvers which
+            need additional data of the dataset, such as the shortest paths between locations.
+        locations (list[Location]): List of unique locations.
+        vehicles (list[Vehicle]): List of vehicles with their details.
+        trucks_realised (dict[TruckIdentifier, Truck]): Dictionary mapping truck identifiers to Truck objects with
+            realised capacity data.
+        trucks_planned (dict[TruckIdentifier, Truck]): Dictionary mapping truck identifiers to Truck objects with
+            planned capacity data.
+
+    Returns:
+        SolveResult: The vehicle and truck assignments together with the data they were computed on and the time taken
+            to solve the problem in seconds.
+    """
+    return _solve_deterministically_on_data(solver_type, dataset_dir_name,
+                                            _copy_data((locations, vehicles, trucks_realised, trucks_planned)))
+
+
+def solve_real_time(solver_type: SolverType, dataset_dir_name: str, realised_capacity_file_name: str,
+                    quantile: float = 0.0) -> \
         tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]:
     """
     Solves the vehicle assignment problem in real-time (only using the realized data as available) using the specified
@@ -145,22 +492,20 @@ def solve_real_time(solver_type: SolverType, dataset_dir_name: str, realised_cap
         solver_type (SolverType): The type of solver to use.
         dataset_dir_name (str): The name of the directory containing the dataset files.
         realised_capacity_file_name (str): The name of the CSV file containing truck capacity data.
+        quantile (float): The quantile value to adjust the planned truck capacities with. Default is 0.0, which keeps
+            the planned capacities.
 
     Returns:
         tuple: A tuple containing:
             - list[VehicleAssignment]: List of vehicle assignments.
             - dict[TruckIdentifier, TruckAssignment]: Dictionary mapping truck identifiers to their assignments.
     """
-    vehicle_assignments, truck_assignments, _, _, _, _, _ = solve_deterministically_and_return_data(
-        solver_type, dataset_dir_name, realised_capacity_file_name)
-    return vehicle_assignments, truck_assignments
+    result = solve_real_time_and_return_data(solver_type, dataset_dir_name, realised_capacity_file_name, quantile)
+    return result.vehicle_assignments, result.truck_assignments
 
 
 def solve_real_time_and_return_data(solver_type: SolverType, dataset_dir_name: str, realised_capacity_file_name: str,
-                                    quantile: float) -> \
-        tuple[
-            list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment], list[Location], list[Vehicle], dict[
-                TruckIdentifier, Truck], dict[TruckIdentifier, Truck], float]:
+                                    quantile: float) -> SolveResult:
     """
     Solves the vehicle assignment problem in real-time (only using the realized data as available) using the specified
     solver type and dataset, and returns additional data.
@@ -172,64 +517,83 @@ def solve_real_time_and_return_data(solver_type: SolverType, dataset_dir_name: s
         quantile (float): The quantile value to adjust the planned truck capacities with. Default is 1.0.
 
     Returns:
-        tuple: A tuple containing:
-            - list[VehicleAssignment]: List of vehicle assignments.
-            - dict[TruckIdentifier, TruckAssignment]: Dictionary mapping truck identifiers to their assignments.
-            - list[Location]: List of unique locations.
-            - list[Vehicle]: List of vehicles with their details.
-            - dict[TruckIdentifier, Truck]: Dictionary mapping truck identifiers to Truck objects with realised capacity data.
-            - dict[TruckIdentifier, Truck]: Dictionary mapping truck identifiers to Truck objects with planned capacity data.
-            - float: The time taken to solve the problem in seconds.
+        SolveResult: The vehicle and truck assignments together with the data they were computed on and the time taken
+            to solve the problem in seconds.
     """
-    locations, vehicles, trucks_realised, trucks_planned = read_data(dataset_dir_name, realised_capacity_file_name)
+    return _solve_real_time_on_data(solver_type, dataset_dir_name,
+                                    _read_data(dataset_dir_name, realised_capacity_file_name), quantile)
+
+
+# Parsed dataset shared with the worker processes of `solve_all_and_return_data`, set by `_initialize_worker`
+_worker_data: tuple[list[Location], list[Vehicle], dict[TruckIdentifier, Truck], dict[TruckIdentifier, Truck]] | None \
+    = None
+
+
+def _initialize_worker(data: tuple[list[Location], list[Vehicle], dict[TruckIdentifier, Truck],
+                                   dict[TruckIdentifier, Truck]]):
+    """
+    Stores the dataset parsed by the parent process, so that the worker does not have to parse it again.
+    """
+    global _worker_data
+    _worker_data = data
+
+
+def _solve_in_worker(solver_type: SolverType, dataset_dir_name: str, real_time: bool, quantile: float) -> SolveResult:
+    """
+    Runs a single solver on a private copy of the dataset stored by `_initialize_worker`.
+    """
+    data = _copy_data(_worker_data)
+    if real_time:
+        return _solve_real_time_on_data(solver_type, dataset_dir_name, data, quantile)
+    return _solve_deterministically_on_data(solver_type, dataset_dir_name, data)
+
+
+def solve_all_and_return_data(solver_types: Iterable[SolverType], dataset_dir_name: str,
+                              realised_capacity_file_name: str, real_time: bool = False, quantile: float = 0.0,
+                              max_workers: int | None = None) -> dict[SolverType, SolveResult]:
+    """
+    Solves the vehicle assignment problem with each of the given solver types in parallel, using one worker process per
+    solver. The dataset is only parsed once, by the calling process, and handed to the workers.
+
+    Note that the solvers compete for the CPU, so the solve times reported in the results may be higher than when
+    running the solvers one after another.
+
+    Args:
+        solver_types (Iterable[SolverType]): The types of solvers to use.
+        dataset_dir_name (str): The name of the directory containing the dataset files.
+        realised_capacity_file_name (str): The name of the CSV file containing truck capacity data.
+        real_time (bool): Whether to solve in real-time (see `solve_real_time_and_return_data`) instead of
+            deterministically (see `solve_deterministically_and_return_data`). Default is False.
+        quantile (float): The quantile value to adjust the planned truck capacities with when solving in real-time.
+            Default is 0.0, which keeps the planned capacities.
+        max_workers (int | None): The maximum number of worker processes. Defaults to one per solver type, capped at
+            the number of CPUs.
+
+    Returns:
+        dict[SolverType, SolveResult]: The result of each solver, in the order of the given solver types.
+    """
+    solver_types = list(solver_types)
+    if not solver_types:
+        return {}
+    if max_workers is None:
+        max_workers = min(len(solver_types), os.cpu_count() or 1)
+
+    data = _read_data_cached(dataset_dir_name, realised_capacity_file_name)
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_initialize_worker, initargs=(data,)) as executor:
+        futures = {executor.submit(_solve_in_worker, solver_type, dataset_dir_name, real_time, quantile): solver_type
+                   for solver_type in solver_types}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return {solver_type: results[solver_type] for solver_type in solver_types}
 
-    if quantile != 0.0:
-        print(f"Adjusting planned truck capacities with quantile: {quantile}")
-        trucks_planned = assign_quantile_based_planned_capacities(trucks_planned, dataset_dir_name, quantile)
 
-    # Start timer
-    start_time = time.time()
-
-    match solver_type:
-        case SolverType.FLOW:
-            flow_network, commodity_groups = create_flow_network(vehicles=vehicles, trucks=trucks_planned,
-                                                                 locations=locations)
-            vehicle_assignments, truck_assignments = solve_flow_in_real_time(flow_network=flow_network,
-                                                                             commodity_groups=commodity_groups,
-                                                                             locations=locations, vehicles=vehicles,
-                                                                             trucks_planned=trucks_planned,
-                                                                             trucks_realised=trucks_realised,
-                                                                             solve_as_mip=False)
-            end_time = time.time() - start_time
-            return vehicle_assignments, truck_assignments, locations, vehicles, trucks_realised, trucks_planned, end_time
-        case SolverType.FLOW_MIP:
-            flow_network, commodity_groups = create_flow_network(vehicles=vehicles, trucks=trucks_planned,
-                                                                 locations=locations)
-            vehicle_assignments, truck_assignments = solve_flow_in_real_time(flow_network=flow_network,
-                                                                             commodity_groups=commodity_groups,
-                                                                             locations=locations, vehicles=vehicles,
-                                                                             trucks_planned=trucks_planned,
-                                                                             trucks_realised=trucks_realised,
-                                                                             solve_as_mip=True)
-            end_time = time.time() - start_time
-            return vehicle_assignments, truck_assignments, locations, vehicles, trucks_realised, trucks_planned, end_time
-        case SolverType.GREEDY:
-            shortest_paths = get_shortest_paths(dataset_dir_name, locations)
-            vehicle_assignments, truck_assignments = greedy_solver(requested_vehicles=vehicles,
-                                                                   trucks_planned=trucks_planned,
-                                                                   trucks_realised=trucks_realised,
-                                                                   shortest_paths=shortest_paths)
-            end_time = time.time() - start_time
-            return vehicle_assignments, truck_assignments, locations, vehicles, trucks_realised, trucks_planned, end_time
-        case SolverType.GREEDY_CANDIDATE_PATHS:
-            logistics_network = create_logistics_network(locations, trucks_realised)
-            candidate_paths = calculate_candidate_paths(logistics_network)
-            vehicle_assignments, truck_assignments = greedy_candidate_path_solver(vehicles, trucks_planned, locations,
-                                                                                  trucks_realised, candidate_paths)
-            end_time = time.time() - start_time
-            return vehicle_assignments, truck_assignments, locations, vehicles, trucks_realised, trucks_planned, end_time
-        case _:
-            raise ValueError(f"This solver type is not supported: {solver_type}")
+# Maps the names of the solver types and their aliases to the solver types
+_SOLVER_TYPES_BY_STRING: dict[str, SolverType] = {solver_type.name: solver_type for solver_type in SolverType} | {
+    "LOWER_BOUND": SolverType.LOWER_BOUND_UNCAPACITATED_FLOW,
+    "CANDIDATE_PATHS": SolverType.GREEDY_CANDIDATE_PATHS,
+    "MIP": SolverType.FLOW_MIP,
+}
 
 
 def solver_type_from_string(solver_type_str: str) -> SolverType:
@@ -237,29 +601,14 @@ def solver_type_from_string(solver_type_str: str) -> SolverType:
     Converts a string representation of a solver type to the corresponding SolverType enum.
 
     Args:
-        solver_type_str (str): The string representation of the solver type.
+        solver_type_str (str): The string representation of the solver type, which is either the name of the solver type
+            or one of its aliases (case-insensitive).
 
     Returns:
         SolverType: The corresponding SolverType enum.
     """
-    if solver_type_str == "FLOW":
-        return SolverType.FLOW
-    elif solver_type_str == "GREEDY":
-        return SolverType.GREEDY
-    elif solver_type_str == "OLD_FLOW":
-        return SolverType.OLD_FLOW
-    elif solver_type_str == "LOWER_BOUND":
-        return SolverType.LOWER_BOUND_UNCAPACITATED_FLOW
-    elif solver_type_str == "LOWER_BOUND_UNCAPACITATED_FLOW":
-        return SolverType.LOWER_BOUND_UNCAPACITATED_FLOW
-    elif solver_type_str == "GREEDY_CANDIDATE_PATHS":
-        return SolverType.GREEDY_CANDIDATE_PATHS
-    elif solver_type_str == "CANDIDATE_PATHS":
-        return SolverType.GREEDY_CANDIDATE_PATHS
-    elif solver_type_str == "FLOW_MIP":
-        return SolverType.FLOW_MIP
-    elif solver_type_str == "MIP":
-        return SolverType.FLOW_MIP
-    else:
+    solver_type = _SOLVER_TYPES_BY_STRING.get(solver_type_str.upper())
+    if solver_type is None:
         raise ValueError(
             f"Unknown solver type: {solver_type_str}. Expected one of: {[str(solver) for solver in SolverType]}")
+    return solver_type
@@ -1,10 +1,11 @@
 from maheu_group_project.heuristics.flow.solve_deterministically import solve_flow_deterministically
 from maheu_group_project.heuristics.flow.network import create_flow_network
-from maheu_group_project.parsing import read_data
-from maheu_group_project.solution.encoding import VehicleAssignment, TruckIdentifier, TruckAssignment, Truck
+from maheu_group_project.solution.encoding import VehicleAssignment, TruckIdentifier, TruckAssignment, Truck, Vehicle, \
+    Location
 
 
-def lower_bound_uncapacitated_flow(dataset_dir_name: str, realised_capacity_file_name: str) -> (
+def lower_bound_uncapacitated_flow(locations: list[Location], vehicles: list[Vehicle],
+                                   trucks_realised: dict[TruckIdentifier, Truck]) -> (
         tuple)[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment], dict[TruckIdentifier, Truck]]:
     """
     Solves the vehicle assignment problem using a flow-based approach with uncapacitated trucks.
@@ -12,27 +13,31 @@ def lower_bound_uncapacitated_flow(dataset_dir_name: str, realised_capacity_file
     Edits the trucks to make them all have practically infinite capacity and then uses the flow network approach from
     `maheu_group_project.heuristics.heuristics.flow` to compute an assignment.
 
+    The given trucks are modified in place, so callers have to pass their own copy of them.
+
     Args:
-        dataset_dir_name (str): The name of the directory containing the dataset files.
-        realised_capacity_file_name (str): The name of the CSV file containing truck capacity data.
+        locations (list[Location]): List of unique locations.
+        vehicles (list[Vehicle]): List of vehicles with their details.
+        trucks_realised (dict[TruckIdentifier, Truck]): Dictionary mapping truck identifiers to Truck objects with
+            realised capacity data. These are made uncapacitated in place.
 
     Returns:
         tuple: A tuple containing:
             - list[VehicleAssignment]: List of vehicle assignments.
             - dict[TruckIdentifier, TruckAssignment]: Dictionary mapping truck identifiers to their assignments.
-            - dict[TruckIdentifier, Truck]: Dictionary mapping truck identifiers to Truck objects with uncapped
-            capacities.
+            - dict[TruckIdentifier, Truck]: The given dictionary of trucks, which now have uncapped capacities.
     """
-    locations, vehicles, trucks_realised, trucks_planned = read_data(dataset_dir_name, realised_capacity_file_name)
-
     # Adapt trucks to make them uncapacitated
     number_of_vehicles = len(vehicles)
-    for truck_identifier, truck in trucks_realised.items():
-        current_capacity = truck.capacity
-        current_price = truck.price
-        factor = (number_of_vehicles // current_capacity) + 1
-        # Set the capacity of each truck to number of vehicles to make them practically uncapacitated
-        trucks_realised[truck_identifier] = truck.new_from_self(capacity=current_capacity * factor, price=current_price * factor)
+    for truck in trucks_realised.values():
+        # Scale the capacity of each truck to at least the number of vehicles to make it practically uncapacitated. The
+        # price is scaled by the same factor to keep the price per vehicle unchanged. This is required, since the costs
+        # (both in the flow network and in the objective function) are the price times the share of the capacity used.
+        # Scaling only the capacity would make transporting a vehicle cheaper and the lower bound invalid.
+        factor = -(-number_of_vehicles // truck.capacity)
+        truck.capacity *= factor
+        truck.price *= factor
+        assert truck.capacity >= number_of_vehicles, f"Truck {truck.get_identifier()} is not uncapacitated"
 
     flow_network, commodity_groups = create_flow_network(vehicles=vehicles, trucks=trucks_realised,
                                                          locations=locations)
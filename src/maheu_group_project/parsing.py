@@ -1,5 +1,7 @@
-import csv
 import datetime
+import functools
+import hashlib
+import pickle
 import re
 import os
 from pathlib import Path
@@ -9,7 +11,22 @@ from maheu_group_project.solution.encoding import Location, TruckIdentifier, Veh
 
 # Get the project root (2 levels up from this file)
 PROJECT_ROOT_PATH = Path(__file__).resolve().parents[2]
-PATH_TO_DATA_FOLDER = os.path.join(PROJECT_ROOT_PATH, "data")
+PATH_TO_DATA_FOLDER = PROJECT_ROOT_PATH / "data"
+
+# Whether to cache parsed datasets (including the capacity history) on disk, in a DISK_CACHE_DIR_NAME directory inside
+# the respective dataset directory. This pays off for the run scripts, which parse every realised capacity file once
+# per solver and again on every run, so they enable it with their --disk-cache option. It is disabled by default.
+USE_DISK_CACHE = False
+DISK_CACHE_DIR_NAME = ".cache"
+# The source files determining the parsed data. Cache files written by a different version of them are invalid.
+_DISK_CACHE_CODE_FILES = (Path(__file__), Path(__file__).parent / "solution" / "encoding.py")
+
+_PATH_SEGMENT_PATTERN = re.compile(
+    r"([A-Z]{3}\d{2}(?:PLANT|TERM|DEALER))([A-Z]{3}\d{2}(?:PLANT|TERM|DEAL))-(TRUCK|TRAIN)-(\d+)")
+_LOCATION_PATTERN = re.compile(r"([A-Z]{3}\d{2})(PLANT|TERM|DEAL)")
+_LOCATION_TYPES = ("PLANT", "TERM", "DEAL")
+_PATH_SEGMENT_START_TYPES = ("PLANT", "TERM", "DEALER")
+_PATH_SEGMENT_END_TYPES = ("PLANT", "TERM", "DEAL")
 
 
 def read_data(dataset_dir_name: str,
@@ -31,45 +48,132 @@ def read_data(dataset_dir_name: str,
             - dict[TruckIdentifier, Truck]: Dictionary mapping truck identifiers to Truck objects. This contains the planned capacity data
                                             for the trucks.
     """
+    source_files = [_dataset_file_path(dataset_dir_name, file_name)
+                    for file_name in ("vehicle_data.csv", realised_capacity_file_name, "planned_capacity_data.csv")]
+    cache_file = _disk_cache_file_path(dataset_dir_name, realised_capacity_file_name)
+
+    data = _load_from_disk_cache(cache_file, source_files)
+    if data is None:
+        data = _parse_data(*source_files)
+        _store_in_disk_cache(cache_file, source_files, data)
+    return data
+
+
+def _parse_data(vehicle_file_name: Path, realised_capacity_file_name: Path, planned_capacity_file_name: Path) -> tuple[
+    list[Location], list[Vehicle], dict[TruckIdentifier, Truck], dict[TruckIdentifier, Truck]]:
+    """
+    Parses the vehicle, realised capacity and planned capacity CSV files at the given paths, see `read_data`.
+    """
     locations: list[Location] = []
     vehicles: list[Vehicle] = []
 
     # import the vehicles from the vehicle_data.csv file
-    with open(os.path.join(PATH_TO_DATA_FOLDER, dataset_dir_name, "vehicle_data.csv")) as csvfile:
-        reader = csv.reader(csvfile, delimiter=';')
-        for row in reader:
-            if row and row[0] == "TRO":
-                vehicle_id = int(row[1])
-                origin = location_from_string(row[4])
-                destination = location_from_string(row[5])
-                available_date = datetime.datetime.strptime(row[6], "%d/%m/%Y-%H:%M:%S").date()
-                due_date = datetime.datetime.strptime(row[8], "%d/%m/%Y-%H:%M:%S").date()
-                vehicle = Vehicle(
-                    # The vehicle_id is 1-based in the CSV, so we subtract 1 to make it 0-based
-                    id=vehicle_id - 1,
-                    origin=origin,
-                    destination=destination,
-                    available_date=available_date,
-                    due_date=due_date
-                )
-                vehicles.append(vehicle)
-
-    trucks_realised, locations = read_trucks_from_file(
-        os.path.join(PATH_TO_DATA_FOLDER, dataset_dir_name, realised_capacity_file_name), locations)
-    trucks_planned, locations = read_trucks_from_file(
-        os.path.join(PATH_TO_DATA_FOLDER, dataset_dir_name, "planned_capacity_data.csv"), locations)
+    for row in _read_rows_with_keyword(vehicle_file_name, "TRO"):
+        vehicle_id = int(row[1])
+        origin = location_from_string(row[4])
+        destination = location_from_string(row[5])
+        available_date = _parse_date(row[6])
+        due_date = _parse_date(row[8])
+        vehicle = Vehicle(
+            # The vehicle_id is 1-based in the CSV, so we subtract 1 to make it 0-based
+            id=vehicle_id - 1,
+            origin=origin,
+            destination=destination,
+            available_date=available_date,
+            due_date=due_date
+        )
+        vehicles.append(vehicle)
+
+    trucks_realised, locations = read_trucks_from_file(realised_capacity_file_name, locations)
+    trucks_planned, locations = read_trucks_from_file(planned_capacity_file_name, locations)
 
     return locations, vehicles, trucks_realised, trucks_planned
 
 
-def read_trucks_from_file(file_name: str, locations: list[Location]) -> tuple[
+def _dataset_file_path(dataset_dir_name: str, file_name: str) -> Path:
+    """
+    Returns the path of the given file of the given dataset.
+    """
+    return PATH_TO_DATA_FOLDER / dataset_dir_name / file_name
+
+
+def _disk_cache_file_path(dataset_dir_name: str, file_name: str) -> Path:
+    """
+    Returns the path of the disk cache file storing the parsed data of the given file of the given dataset.
+    """
+    return PATH_TO_DATA_FOLDER / dataset_dir_name / DISK_CACHE_DIR_NAME / f"{file_name}.pickle"
+
+
+def _disk_cache_key(source_files: list[Path]) -> tuple:
+    """
+    Returns the key identifying the state of the given source files, which a cache file has to match to be valid.
+    """
+    key = [_disk_cache_code_hash()]
+    for file_name in source_files:
+        stat = file_name.stat()
+        key.append((file_name.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+
+@functools.cache
+def _disk_cache_code_hash() -> str:
+    """
+    Returns a hash of the code which parses the data and defines the parsed classes, see `_DISK_CACHE_CODE_FILES`.
+    """
+    code_hash = hashlib.sha256()
+    for code_file in _DISK_CACHE_CODE_FILES:
+        code_hash.update(code_file.read_bytes())
+    return code_hash.hexdigest()
+
+
+def _load_from_disk_cache(cache_file: Path, source_files: list[Path]):
+    """
+    Returns the data stored in the given cache file, or None if disk caching is disabled, there is no cache file, or it
+    is outdated with respect to the given source files or the parsing code.
+
+    Note that the cache files are pickles, so they must only ever be written by `_store_in_disk_cache`.
+    """
+    if not USE_DISK_CACHE:
+        return None
+    try:
+        with open(cache_file, "rb") as file:
+            # The key is stored as its own record in front of the data, so that outdated data is never unpickled
+            if pickle.load(file) != _disk_cache_key(source_files):
+                return None
+            return pickle.load(file)
+    except Exception:
+        # A missing, corrupt or incompatible cache file (e.g. one referencing renamed classes) is treated as a cache
+        # miss and overwritten
+        return None
+
+
+def _store_in_disk_cache(cache_file: Path, source_files: list[Path], data):
+    """
+    Stores the given data in the given cache file, preceded by the key of the given source files. The file is written
+    atomically, so concurrent readers never observe a partially written cache file. Failing to write the cache (e.g.
+    because the data directory is read-only) is not an error.
+    """
+    if not USE_DISK_CACHE:
+        return
+    temporary_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary_file, "wb") as file:
+            pickle.dump(_disk_cache_key(source_files), file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file, cache_file)
+    except OSError:
+        temporary_file.unlink(missing_ok=True)
+
+
+def read_trucks_from_file(file_name: str | Path, locations: list[Location]) -> tuple[
     dict[TruckIdentifier, Truck], list[Location]]:
     """
     Reads the truck data from a CSV file and returns a dictionary of trucks and a list of unique locations.
     Can be used for both realised and planned capacity data.
 
     Args:
-        file_name (str): The name of the CSV file containing truck data.
+        file_name (str | Path): The path of the CSV file containing truck data.
         locations (list[Location]): A list to store unique locations found in the truck data.
 
     Returns:
@@ -77,63 +181,165 @@ def read_trucks_from_file(file_name: str, locations: list[Location]) -> tuple[
             - dict[TruckIdentifier, Truck]: A dictionary mapping truck identifiers to Truck objects.
             - list[Location]: A list of unique locations found in the truck data.
     """
-    trucks: dict[TruckIdentifier, Truck] = {}
+    # The trucks are collected as (identifier, truck) pairs and turned into a dictionary at once in the end
+    truck_items: list[tuple[TruckIdentifier, Truck]] = []
+    # Set of the locations already contained in the list, to check for duplicates in constant time
+    known_locations: set[Location] = set(locations)
     # import the trucks from the realised_capacity_data file
-    with open(file_name) as csvfile:
-        reader = csv.reader(csvfile, delimiter=';')
-        for row in reader:
-            if row and row[0] == "PLT":
-                path_segment = row[3]
-
-                match = re.match(
-                    r"([A-Z]{3}\d{2}(?:PLANT|TERM|DEALER))([A-Z]{3}\d{2}(?:PLANT|TERM|DEAL))-(TRUCK|TRAIN)-(\d+)",
-                    path_segment)
-
-                if match:
-                    start_code = match.group(1)
-                    end_code = match.group(2)
-                    truck_number = int(match.group(4))
-                    if match.group(3) == "TRAIN":
-                        truck_number += 10
+    for row in _read_rows_with_keyword(file_name, "PLT"):
+        path_segment = row[3]
+
+        parsed_path_segment = _parse_path_segment(path_segment)
+        if parsed_path_segment is None:
+            print("No match found for path segment:", path_segment)
+            continue
+        start_code, end_code, truck_number = parsed_path_segment
+
+        start_location = location_from_string(start_code)
+        end_location = location_from_string(end_code)
+
+        # from all appeared start / end locations make the list locations (without duplicates)
+        if start_location not in known_locations:
+            known_locations.add(start_location)
+            locations.append(start_location)
+        if end_location not in known_locations:
+            known_locations.add(end_location)
+            locations.append(end_location)
+
+        departure_date = _parse_date(row[4])
+        arrival_date = _parse_date(row[5])
+
+        capacity = int(float(row[6]))
+        price = int(float(row[7]))
+
+        truck_id = TruckIdentifier(
+            start_location=start_location,
+            end_location=end_location,
+            truck_number=truck_number,
+            departure_date=departure_date,
+        )
+
+        truck = Truck(
+            start_location=start_location,
+            end_location=end_location,
+            departure_date=departure_date,
+            arrival_date=arrival_date,
+            truck_number=truck_number,
+            capacity=capacity,
+            price=price,
+        )
+
+        truck_items.append((truck_id, truck))
+
+    return dict(truck_items), locations
+
+
+def _read_lines(file_name: str | Path) -> list[str]:
+    """
+    Returns the lines of the given data file.
+
+    The data files are read as a whole and their rows are split at every ';' with `str.split` instead of using the csv
+    module, since they contain no quoted fields.
+
+    Args:
+        file_name (str | Path): The path of the CSV file to read.
+
+    Returns:
+        list[str]: The lines of the file, without line breaks.
+    """
+    return Path(file_name).read_text(encoding="utf-8").splitlines()
 
-                else:
-                    print("No match found for path segment:", path_segment)
 
-                start_location = location_from_string(start_code)
-                end_location = location_from_string(end_code)
+def _read_rows_with_keyword(file_name: str | Path, keyword: str) -> list[list[str]]:
+    """
+    Returns the rows of the given data file which start with the given keyword, e.g. 'PLT', split into their fields.
+
+    The other rows (comments and rows with different keywords) are skipped by a prefix check on the raw line, so they
+    are never split.
+
+    Args:
+        file_name (str | Path): The path of the CSV file to read.
+        keyword (str): The keyword in the first field of the rows to return.
+
+    Returns:
+        list[list[str]]: The fields of the matching rows.
+    """
+    prefix = keyword + ";"
+    return [line.split(";") for line in _read_lines(file_name) if line.startswith(prefix)]
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_date(date_str: str) -> datetime.date:
+    """
+    Parses a date and time in the format used in the data files, e.g. '01/02/2025-08:00:00', and returns its date.
+    Dates in the usual fixed-width format are sliced directly, others are parsed with strptime. Results are cached,
+    since the same few hundred dates appear in many rows of the data files.
+
+    Args:
+        date_str (str): The date and time as given in the data files.
+
+    Returns:
+        datetime.date: The date of the given date and time.
+    """
+    if len(date_str) == 19 and date_str[2] == date_str[5] == "/" and date_str[10] == "-":
+        return datetime.date(int(date_str[6:10]), int(date_str[3:5]), int(date_str[:2]))
+    return datetime.datetime.strptime(date_str, "%d/%m/%Y-%H:%M:%S").date()
+
+
+def _parse_path_segment(path_segment: str) -> tuple[str, str, int] | None:
+    """
+    Splits a path segment such as 'GER01PLANTBEL01TERM-TRUCK-3' into the codes of its start and end location and its
+    truck number. Trains get their number increased by 10 to distinguish them from trucks on the same segment.
+
+    Args:
+        path_segment (str): The path segment as given in the capacity data.
 
-                # from all appeared start / end locations make the list locations (without duplicates)
-                if start_location not in locations:
-                    locations.append(start_location)
-                if end_location not in locations:
-                    locations.append(end_location)
+    Returns:
+        tuple[str, str, int] | None: The start location code, the end location code and the truck number, or None if
+            the path segment is malformed.
+    """
+    # Fast path for well-formed path segments, which avoids the regular expression
+    codes, _, transport_and_number = path_segment.partition("-")
+    transport, _, number = transport_and_number.partition("-")
+    if (transport == "TRUCK" or transport == "TRAIN") and number.isdecimal():
+        for start_type in _PATH_SEGMENT_START_TYPES:
+            if codes.startswith(start_type, 5):
+                start_code_length = 5 + len(start_type)
+                end_code = codes[start_code_length:]
+                if end_code[5:] in _PATH_SEGMENT_END_TYPES:
+                    truck_number = int(number)
+                    if transport == "TRAIN":
+                        truck_number += 10
+                    return codes[:start_code_length], end_code, truck_number
+                break
 
-                departure_date = datetime.datetime.strptime(row[4], "%d/%m/%Y-%H:%M:%S").date()
-                arrival_date = datetime.datetime.strptime(row[5], "%d/%m/%Y-%H:%M:%S").date()
+    match = _PATH_SEGMENT_PATTERN.match(path_segment)
+    if match is None:
+        return None
+    truck_number = int(match.group(4))
+    if match.group(3) == "TRAIN":
+        truck_number += 10
+    return match.group(1), match.group(2), truck_number
 
-                capacity = int(float(row[6]))
-                price = int(float(row[7]))
 
-                truck_id = TruckIdentifier(
-                    start_location=start_location,
-                    end_location=end_location,
-                    truck_number=truck_number,
-                    departure_date=departure_date,
-                )
+def _parse_location_code(location_code: str) -> Location | None:
+    """
+    Parses a location code such as 'GER01PLANT' as given in the paths of the base data.
 
-                truck = Truck(
-                    start_location=start_location,
-                    end_location=end_location,
-                    departure_date=departure_date,
-                    arrival_date=arrival_date,
-                    truck_number=truck_number,
-                    capacity=capacity,
-                    price=price,
-                )
+    Args:
+        location_code (str): The location code.
 
-                trucks[truck_id] = truck
+    Returns:
+        Location | None: The corresponding Location, or None if the location code is malformed.
+    """
+    # Fast path for well-formed location codes, which avoids the regular expression
+    if location_code[5:] in _LOCATION_TYPES:
+        return location_from_string(location_code)
 
-    return trucks, locations
+    match = _LOCATION_PATTERN.match(location_code)
+    if match is None:
+        return None
+    return Location(name=match.group(1), type=location_type_from_string(match.group(2)))
 
 
 def get_shortest_paths(dataset_dir_name: str, locations: list[Location]) -> dict[
@@ -154,46 +360,53 @@ def get_shortest_paths(dataset_dir_name: str, locations: list[Location]) -> dict
     shortest_paths: dict[tuple[Location, Location], list[Location]] = {}
 
     # Read the base_data.csv file to get the paths
-    with open(os.path.join(PATH_TO_DATA_FOLDER, dataset_dir_name, "base_data.csv")) as csvfile:
-        reader = list(csv.reader(csvfile, delimiter=';'))
+    # Only the PTH rows and the PTHSG rows following them are needed, so the other rows are skipped before splitting
+    rows = [line.split(";") for line in _read_lines(_dataset_file_path(dataset_dir_name, "base_data.csv"))
+            if line.startswith("PTH")]
 
     plants = [loc for loc in locations if loc.type == LocationType.PLANT]
     dealers = [loc for loc in locations if loc.type == LocationType.DEALER]
+    # Set of the given locations, to check whether a location on a path is known in constant time
+    known_locations = set(locations)
+
+    # Index the PTH rows by their start and end location code, to not scan the whole file for each pair. There may be
+    # multiple paths for the same pair, their row indices are stored in the order of the file.
+    path_rows_by_codes: dict[tuple[str, str], list[int]] = {}
+    for i, row in enumerate(rows):
+        if row and row[0] == "PTH":
+            path_rows_by_codes.setdefault((row[3], row[4]), []).append(i)
 
     for plant in plants:
+        plant_code = plant.name + "PLANT"
         for dealer in dealers:
-            for i, row in enumerate(reader):
-                if row and row[0] == "PTH" and row[3] == plant.name + "PLANT" and row[4] == dealer.name + "DEAL":
-                    path = [plant]
-                    offset = 1
-                    while i + offset < len(reader):
-                        next_row = reader[i + offset]
-                        if len(next_row) <= 6:
-                            print("malformed row, breaking")
-                            break
-
-                        location_as_string = next_row[6]
-                        match = re.match(r"([A-Z]{3}\d{2})(PLANT|TERM|DEAL)", location_as_string)
-                        if match:
-                            name = match.group(1)
-                            loc_type = location_type_from_string(match.group(2))
-                            location = Location(name=name, type=loc_type)
-                            if location in locations:
-                                path.append(location)
-                            else:
-                                path = []
-                                break
+            for i in path_rows_by_codes.get((plant_code, dealer.name + "DEAL"), ()):
+                path = [plant]
+                offset = 1
+                while i + offset < len(rows):
+                    next_row = rows[i + offset]
+                    if len(next_row) <= 6:
+                        print("malformed row, breaking")
+                        break
+
+                    location_as_string = next_row[6]
+                    location = _parse_location_code(location_as_string)
+                    if location is not None:
+                        if location in known_locations:
+                            path.append(location)
                         else:
-                            print("no match for ", location_as_string)
-                            break
-
-                        offset += 1
-                        if i + offset >= len(reader) or reader[i + offset][0] != "PTHSG":
+                            path = []
                             break
-                    if path != [plant] and path != []:
-                        if (plant, dealer) not in shortest_paths or shortest_paths[(plant, dealer)] == [plant] or len(
-                                path) < len(shortest_paths[(plant, dealer)]):
-                            shortest_paths[(plant, dealer)] = path
+                    else:
+                        print("no match for ", location_as_string)
+                        break
+
+                    offset += 1
+                    if i + offset >= len(rows) or rows[i + offset][0] != "PTHSG":
+                        break
+                if path != [plant] and path != []:
+                    if (plant, dealer) not in shortest_paths or shortest_paths[(plant, dealer)] == [plant] or len(
+                            path) < len(shortest_paths[(plant, dealer)]):
+                        shortest_paths[(plant, dealer)] = path
 
     return shortest_paths
 
@@ -203,46 +416,51 @@ def read_history_data(dataset_dir_name: str) -> dict[TruckIdentifier, Truck]:
     Reads the truck history data from capacity_history.csv for the given dataset directory.
     Returns a dictionary mapping TruckIdentifier to Truck.
     """
+    file_path = _dataset_file_path(dataset_dir_name, "capacity_history.csv")
+    cache_file = _disk_cache_file_path(dataset_dir_name, "capacity_history.csv")
+
+    trucks = _load_from_disk_cache(cache_file, [file_path])
+    if trucks is None:
+        trucks = _parse_history_data(file_path)
+        _store_in_disk_cache(cache_file, [file_path], trucks)
+    return trucks
+
+
+def _parse_history_data(file_path: Path) -> dict[TruckIdentifier, Truck]:
+    """
+    Parses the capacity history CSV file at the given path, see `read_history_data`.
+    """
     trucks: dict[TruckIdentifier, Truck] = {}
-    file_path = os.path.join(PATH_TO_DATA_FOLDER, dataset_dir_name, "capacity_history.csv")
-    with open(file_path) as csvfile:
-        reader = csv.reader(csvfile, delimiter=';')
-        for row in reader:
-            # Skip the row with row information/labels
-            if row[0] == "#PathSegment":
-                continue
-            path_segment = row[0]
-            match = re.match(
-                r"([A-Z]{3}\d{2}(?:PLANT|TERM|DEALER))([A-Z]{3}\d{2}(?:PLANT|TERM|DEAL))-(TRUCK|TRAIN)-(\d+)",
-                path_segment)
-            if match:
-                start_code = match.group(1)
-                end_code = match.group(2)
-                truck_number = int(match.group(4))
-                if match.group(3) == "TRAIN":
-                    truck_number += 10
-            else:
-                print("No match found for path segment:", path_segment)
-                continue
-            start_location = location_from_string(start_code)
-            end_location = location_from_string(end_code)
-            departure_date = datetime.datetime.strptime(row[2], "%d/%m/%Y-%H:%M:%S").date()
-            capacity = int(float(row[3]))
-            price = int(float(row[4]))
-            truck_id = TruckIdentifier(
-                start_location=start_location,
-                end_location=end_location,
-                truck_number=truck_number,
-                departure_date=departure_date,
-            )
-            truck = Truck(
-                start_location=start_location,
-                end_location=end_location,
-                departure_date=departure_date,
-                arrival_date=None,
-                truck_number=truck_number,
-                capacity=capacity,
-                price=price,
-            )
-            trucks[truck_id] = truck
+    for line in _read_lines(file_path):
+        # Skip the row with row information/labels
+        if line.startswith("#PathSegment;"):
+            continue
+        row = line.split(";")
+        path_segment = row[0]
+        parsed_path_segment = _parse_path_segment(path_segment)
+        if parsed_path_segment is None:
+            print("No match found for path segment:", path_segment)
+            continue
+        start_code, end_code, truck_number = parsed_path_segment
+        start_location = location_from_string(start_code)
+        end_location = location_from_string(end_code)
+        departure_date = _parse_date(row[2])
+        capacity = int(float(row[3]))
+        price = int(float(row[4]))
+        truck_id = TruckIdentifier(
+            start_location=start_location,
+            end_location=end_location,
+            truck_number=truck_number,
+            departure_date=departure_date,
+        )
+        truck = Truck(
+            start_location=start_location,
+            end_location=end_location,
+            departure_date=departure_date,
+            arrival_date=None,
+            truck_number=truck_number,
+            capacity=capacity,
+            price=price,
+        )
+        trucks[truck_id] = truck
     return trucks
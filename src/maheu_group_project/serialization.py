@@ -82,12 +82,11 @@ def serialize_truck_assignments(truck_assignments: dict[TruckIdentifier, TruckAs
         truck_assignments: Dictionary mapping TruckIdentifier to TruckAssignment
         file_path: Path where to save the serialized data
     """
-    serializable_data = {}
-
-    for truck_id, assignment in truck_assignments.items():
-        # Convert TruckIdentifier to a string key for JSON
-        truck_key = json.dumps(_truck_identifier_to_dict(truck_id), sort_keys=True)
-        serializable_data[truck_key] = _truck_assignment_to_dict(assignment)
+    # Store a list of pairs, since a TruckIdentifier cannot be a key of a JSON object without encoding it as a string
+    serializable_data = [
+        {"truck_id": _truck_identifier_to_dict(truck_id), "assignment": _truck_assignment_to_dict(assignment)}
+        for truck_id, assignment in truck_assignments.items()
+    ]
 
     with open(file_path, "w") as f:
         json.dump(serializable_data, f, indent=2)
@@ -106,16 +105,13 @@ def deserialize_truck_assignments(file_path: str) -> dict[TruckIdentifier, Truck
     with open(file_path, "r") as f:
         serialized_data = json.load(f)
 
-    truck_assignments = {}
-
-    for truck_key_str, assignment_data in serialized_data.items():
-        # Convert the string key back to TruckIdentifier
-        truck_id_dict = json.loads(truck_key_str)
-        truck_id = _truck_identifier_from_dict(truck_id_dict)
-        assignment = _truck_assignment_from_dict(assignment_data)
-        truck_assignments[truck_id] = assignment
+    if isinstance(serialized_data, dict):
+        # Files written by older versions map the TruckIdentifiers, encoded as JSON strings, to the assignments
+        return {_truck_identifier_from_dict(json.loads(truck_key_str)): _truck_assignment_from_dict(assignment_data)
+                for truck_key_str, assignment_data in serialized_data.items()}
 
-    return truck_assignments
+    return {_truck_identifier_from_dict(item["truck_id"]): _truck_assignment_from_dict(item["assignment"])
+            for item in serialized_data}
 
 
 def serialize_vehicle_assignments(vehicle_assignments: list[VehicleAssignment], file_path: str):
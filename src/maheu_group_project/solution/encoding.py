@@ -1,6 +1,8 @@
+import functools
+import sys
 from datetime import date, timedelta
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 
 # Constants for costs of delays
 FIXED_PLANNED_DELAY_COST = 200
@@ -23,23 +25,26 @@ class LocationType(Enum):
 
     def __str__(self) -> str:
         """
-        Returns a string representation of the location type.
+        Returns a string representation of the location type, as used in the data files.
         """
-        match self:
-            case LocationType.PLANT:
-                return "PLANT"
-            case LocationType.TERMINAL:
-                return "TERM"
-            case LocationType.DEALER:
-                return "DEAL"
-        # Should be unreachable, just here to make the linter happy
-        raise ValueError(f"Invalid LocationType: {self}")
+        return _LOCATION_TYPE_STRINGS[self]
 
 
+# The string representations of the location types, and their inverse used by `location_type_from_string`
+_LOCATION_TYPE_STRINGS: dict[LocationType, str] = {
+    LocationType.PLANT: "PLANT",
+    LocationType.TERMINAL: "TERM",
+    LocationType.DEALER: "DEAL",
+}
+_LOCATION_TYPES_BY_STRING: dict[str, LocationType] = {string: location_type for location_type, string in
+                                                      _LOCATION_TYPE_STRINGS.items()}
+
+
+@functools.lru_cache(maxsize=None)
 def location_type_from_string(location_type_str: str) -> LocationType:
     """
     Tries to convert a string to a LocationType enum. Valid strings are 'PLANT', 'TERM', and 'DEAL'.
-    Raises ValueError if the string does not match any valid location type.
+    Raises ValueError if the string does not match any valid location type. Results are cached.
 
     Args:
         location_type_str (str): The string representation of the location type.
@@ -47,18 +52,13 @@ def location_type_from_string(location_type_str: str) -> LocationType:
     Returns:
         LocationType: The corresponding LocationType enum.
     """
-    match location_type_str.upper():
-        case "PLANT":
-            return LocationType.PLANT
-        case "TERM":
-            return LocationType.TERMINAL
-        case "DEAL":
-            return LocationType.DEALER
-        case _:
-            raise ValueError(f"Invalid location type: {location_type_str}")
-
-
-@dataclass(frozen=True)
+    location_type = _LOCATION_TYPES_BY_STRING.get(location_type_str.upper())
+    if location_type is None:
+        raise ValueError(f"Invalid location type: {location_type_str}")
+    return location_type
+
+
+@dataclass(frozen=True, slots=True)
 class Location:
     """
     Represents a physical location.
@@ -71,11 +71,13 @@ class Location:
     type: LocationType
 
 
+@functools.lru_cache(maxsize=None)
 def location_from_string(location_str: str) -> Location:
     """
     Converts a string representation of a location into a Location object.
     The string should be in the format 'NameNumberType', where 'Name' is the three-letter name of the location
     e.g. GER or FRA, 'Number' is a two-digit number, and 'Type' is one of 'PLANT', 'TERM', or 'DEAL'.
+    Results are cached, so the same string always yields the same (immutable) Location object.
 
     Args:
         location_str (str): The string representation of the location.
@@ -83,11 +85,12 @@ def location_from_string(location_str: str) -> Location:
     Returns:
         Location: The corresponding Location object.
     """
-    name, type_str = location_str[:5], location_str[5:]
+    # The name is interned, since it is compared whenever a Location is used as (part of) a dictionary key
+    name, type_str = sys.intern(location_str[:5]), location_str[5:]
     return Location(name=name, type=location_type_from_string(type_str))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TruckIdentifier:
     """
     Uniquely identifies a truck (or a general transport vehicle).
@@ -102,9 +105,22 @@ class TruckIdentifier:
     end_location: Location
     truck_number: int
     departure_date: date
+    # Truck identifiers are used as dictionary keys throughout, so their hash is computed only once
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_hash",
+                           hash((self.start_location, self.end_location, self.truck_number, self.departure_date)))
 
+    def __hash__(self) -> int:
+        return self._hash
 
-@dataclass
+    def __reduce__(self):
+        # String hashes differ between processes, so the hash must not be pickled but recomputed when unpickling
+        return TruckIdentifier, (self.start_location, self.end_location, self.truck_number, self.departure_date)
+
+
+@dataclass(slots=True)
 class Truck:
     """
     Represents a truck (or a general transport vehicle) transporting vehicles between locations.
@@ -128,16 +144,6 @@ class Truck:
     capacity: int
     price: int
 
-    def __init__(self, start_location: Location, end_location: Location, departure_date: date,
-                 arrival_date: date, truck_number: int, capacity: int, price: int):
-        self.start_location = start_location
-        self.end_location = end_location
-        self.departure_date = departure_date
-        self.arrival_date = arrival_date
-        self.truck_number = truck_number
-        self.capacity = capacity
-        self.price = price
-
     def get_identifier(self):
         """
         Converts the Truck instance to a TruckIdentifier.
@@ -170,35 +176,20 @@ class Truck:
         Returns:
             Truck: A new Truck instance with the updated attributes.
         """
-        return Truck(
-            start_location=self.start_location if start_location is None else start_location,
-            end_location=self.end_location if end_location is None else end_location,
-            departure_date=self.departure_date if departure_date is None else departure_date,
-            arrival_date=self.arrival_date if arrival_date is None else arrival_date,
-            truck_number=self.truck_number if truck_number is None else truck_number,
-            capacity=self.capacity if capacity is None else capacity,
-            price=self.price if price is None else price,
-        )
+        changes = dict(start_location=start_location, end_location=end_location, departure_date=departure_date,
+                       arrival_date=arrival_date, truck_number=truck_number, capacity=capacity, price=price)
+        return replace(self, **{name: value for name, value in changes.items() if value is not None})
 
 
-@dataclass
+@dataclass(slots=True)
 class TruckAssignment:
     """
     Represents the assignment a solution has made for a truck.
 
     Attributes:
-        load (list[int]): List of vehicle IDs assigned to be loaded on the truck.
+        load (list[int]): List of vehicle IDs assigned to be loaded on the truck. Defaults to an empty list.
     """
-    load: list[int]
-
-    def __init__(self, load: list[int] = None):
-        """
-        Initializes a TruckAssignment instance.
-        Args:
-            load (list[int], optional): List of vehicle IDs assigned to be loaded on the truck.
-                If omitted, it defaults to an empty list.
-        """
-        self.load = load if load is not None else []
+    load: list[int] = field(default_factory=list)
 
     def get_capacity_left(self, truck: Truck) -> int:
         """
@@ -214,7 +205,7 @@ class TruckAssignment:
         assert capacity_left >= 0, f"Truck {truck.get_identifier()} has negative capacity left: {capacity_left}"
         return capacity_left
 
-@dataclass
+@dataclass(slots=True)
 class Vehicle:
     """
     Represents a vehicle to be transported.
@@ -232,48 +223,24 @@ class Vehicle:
     available_date: date
     due_date: date
 
-    def __init__(self, id: int, origin: Location, destination: Location, available_date: date,
-                 due_date: date):
-        self.id = id
-        self.origin = origin
-        self.destination = destination
-        self.available_date = available_date
-        self.due_date = due_date
 
-
-@dataclass
+@dataclass(slots=True)
 class VehicleAssignment:
     """
     Represents the assignment a solution has made for a single vehicle.
 
     Attributes:
         id (int): Unique identifier for the vehicle whose assignment is being represented.
-        paths_taken (list[TruckIdentifier]): List of truck segments the vehicle is assigned to.
-        planned_delayed (bool): Indicates if the vehicle is planned to be delayed.
-        delayed_by (datetime.timedelta): Duration by which the vehicle is planned to be delayed.
+        paths_taken (list[TruckIdentifier]): List of truck segments the vehicle is assigned to. Defaults to an empty
+            list.
+        planned_delayed (bool): Indicates if the vehicle is planned to be delayed. Defaults to False.
+        delayed_by (datetime.timedelta): Duration by which the vehicle is planned to be delayed. Defaults to a zero
+            timedelta (no delay).
     """
     id: int
-    paths_taken: list[TruckIdentifier]
-    planned_delayed: bool
-    delayed_by: timedelta
-
-    def __init__(self, id: int, paths_taken: list[TruckIdentifier] = None, planned_delayed: bool = False,
-                 delayed_by: timedelta = timedelta(0)):
-        """
-        Initializes a VehicleAssignment instance.
-
-        Args:
-            paths_taken (list[TruckIdentifier], optional): List of truck segments the vehicle is assigned to.
-                If omitted, it defaults to an empty list.
-            planned_delayed (bool, optional): Indicates if the vehicle is planned to be delayed.
-                If omitted, it defaults to False.
-            delayed_by (timedelta, optional): Duration by which the vehicle is planned to be delayed.
-                If omitted, it defaults to a zero timedelta (no delay).
-        """
-        self.id = id
-        self.paths_taken = paths_taken if paths_taken is not None else []
-        self.planned_delayed = planned_delayed
-        self.delayed_by = delayed_by
+    paths_taken: list[TruckIdentifier] = field(default_factory=list)
+    planned_delayed: bool = False
+    delayed_by: timedelta = timedelta(0)
 
 
 def convert_vehicle_assignments_to_truck_assignments(vehicle_assignments: list[VehicleAssignment],
@@ -288,16 +255,14 @@ def convert_vehicle_assignments_to_truck_assignments(vehicle_assignments: list[V
     Returns:
         dict[TruckIdentifier, TruckAssignment]: Dictionary mapping truck identifiers to their respective assignments.
     """
-    truck_assignments: dict[TruckIdentifier, TruckAssignment] = {}
+    # Ensure that all trucks are contained in the truck_assignments dictionary, even if they are not used
+    truck_assignments: dict[TruckIdentifier, TruckAssignment] = {truck_id: TruckAssignment() for truck_id in trucks}
     for vehicle in vehicle_assignments:
         for truck_identifier in vehicle.paths_taken:
-            if truck_identifier not in truck_assignments:
-                truck_assignments[truck_identifier] = TruckAssignment()
-            truck_assignments[truck_identifier].load.append(vehicle.id)
-
-    # Ensure that all trucks are contained in the truck_assignments dictionary
-    for truck_id in trucks.keys():
-        if truck_id not in truck_assignments:
-            truck_assignments[truck_id] = TruckAssignment()
+            truck_assignment = truck_assignments.get(truck_identifier)
+            if truck_assignment is None:
+                # The truck is not part of the given trucks
+                truck_assignment = truck_assignments[truck_identifier] = TruckAssignment()
+            truck_assignment.load.append(vehicle.id)
 
     return truck_assignments
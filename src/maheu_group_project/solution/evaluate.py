@@ -1,7 +1,7 @@
 from maheu_group_project.solution.encoding import FIXED_PLANNED_DELAY_COST, FIXED_UNPLANNED_DELAY_COST, \
     COST_PER_PLANNED_DELAY_DAY, \
     COST_PER_UNPLANNED_DELAY_DAY, TruckIdentifier, Truck, TruckAssignment, VehicleAssignment, Vehicle
-from datetime import timedelta
+from datetime import date, timedelta
 
 
 def objective_function(vehicle_assignments: list[VehicleAssignment],
@@ -21,10 +21,13 @@ def objective_function(vehicle_assignments: list[VehicleAssignment],
     """
     objective_value = 0  # Initialize the objective value to 0
     for truck_identifier, truck_assignment in truck_assignments.items():
-        if not len(truck_assignment.load) == 0:
-            # For each truck with a non-empty load, add the corresponding price to the objective value
-            objective_value += trucks[truck_identifier].price * len(truck_assignment.load) / trucks[
-                truck_identifier].capacity
+        load_size = len(truck_assignment.load)
+        if load_size == 0:
+            # Unused trucks do not incur any costs
+            continue
+        # For each truck with a non-empty load, add the corresponding price to the objective value
+        truck = trucks[truck_identifier]
+        objective_value += truck.price * load_size / truck.capacity
     for vehicle in vehicle_assignments:
         # Convert the delay to a float value in number of days
         delay_in_days = vehicle.delayed_by.days
@@ -63,15 +66,17 @@ def remove_horizon(vehicle_assignments: list[VehicleAssignment], vehicles: list[
             Filtered vehicle assignments and truck assignments that do not lie in the front or back horizon.
     """
 
-    first_day = min(vehicle.available_date for vehicle in vehicles)
-    last_day = max(vehicle.available_date for vehicle in vehicles)
+    first_day, last_day = _get_first_and_last_available_date(vehicles)
+    # The first and last day which do not lie in the front or back horizon
+    start_of_period = first_day + timedelta(front_horizon)
+    end_of_period = last_day - timedelta(back_horizon)
     trucks = {**trucks_realised, **trucks_planned}  # Combine realised and expected trucks
     # Remove vehicles that become available in front or back horizon
     vehicle_assignments = [va for va in vehicle_assignments if
-                           last_day - timedelta(back_horizon) >= vehicles[va.id].available_date >= first_day + timedelta(front_horizon)]
+                           end_of_period >= vehicles[va.id].available_date >= start_of_period]
     # Remove trucks that start in the front or back horizon
     truck_assignments = {truck_id: t_a for truck_id, t_a in truck_assignments.items() if
-                         last_day - timedelta(back_horizon) >= trucks[truck_id].departure_date >= first_day + timedelta(front_horizon)}
+                         end_of_period >= trucks[truck_id].departure_date >= start_of_period}
     return vehicle_assignments, truck_assignments
 
 
@@ -98,15 +103,36 @@ def remove_horizon_keep_used_trucks(vehicle_assignments: list[VehicleAssignment]
         tuple[list[VehicleAssignment], dict[TruckIdentifier, TruckAssignment]]: Filtered vehicle assignments and truck assignments.
     """
 
-    first_day = min(vehicle.available_date for vehicle in vehicles)
-    last_day = max(vehicle.available_date for vehicle in vehicles)
+    first_day, last_day = _get_first_and_last_available_date(vehicles)
+    # The first and last day which do not lie in the front or back horizon
+    start_of_period = first_day + timedelta(front_horizon)
+    end_of_period = last_day - timedelta(back_horizon)
     # Remove vehicles that become available in front or back horizon
     vehicle_assignments = [va for va in vehicle_assignments if
-                           last_day - timedelta(back_horizon) >= vehicles[va.id].available_date >= first_day + timedelta(front_horizon)]
-    # Remove all vehicles that are not in the filtered vehicle assignments from the truck loads
-    for truck_id, t_a in truck_assignments.items():
-        for vehicle_id in t_a.load:
-            if vehicle_id not in [va.id for va in vehicle_assignments]:
-                # If the vehicle assignment is not in the filtered vehicle assignments, remove it from the truck assignment
-                truck_assignments[truck_id].load.remove(vehicle_id)
+                           end_of_period >= vehicles[va.id].available_date >= start_of_period]
+    # Remove all vehicles that are not in the filtered vehicle assignments from the truck loads. The loads are rebuilt
+    # instead of removing from them while iterating over them, which would skip the element after each removed one.
+    kept_vehicle_ids = {va.id for va in vehicle_assignments}
+    for t_a in truck_assignments.values():
+        t_a.load = [vehicle_id for vehicle_id in t_a.load if vehicle_id in kept_vehicle_ids]
     return vehicle_assignments, truck_assignments
+
+
+def _get_first_and_last_available_date(vehicles: list[Vehicle]) -> tuple[date, date]:
+    """
+    Returns the earliest and latest availability date of the given vehicles, computed in a single pass.
+
+    Args:
+        vehicles (list[Vehicle]): Non-empty list of vehicles.
+
+    Returns:
+        tuple[date, date]: The first and the last day on which any of the vehicles becomes available.
+    """
+    first_day = last_day = vehicles[0].available_date
+    for vehicle in vehicles:
+        available_date = vehicle.available_date
+        if available_date < first_day:
+            first_day = available_date
+        elif available_date > last_day:
+            last_day = available_date
+    return first_day, last_day
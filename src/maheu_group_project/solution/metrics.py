@@ -1,8 +1,11 @@
 from datetime import timedelta
+from typing import Iterator, NamedTuple
 
 from maheu_group_project.solution.encoding import VehicleAssignment, TruckAssignment, TruckIdentifier, Truck, \
     COST_PER_PLANNED_DELAY_DAY, FIXED_UNPLANNED_DELAY_COST, FIXED_PLANNED_DELAY_COST, COST_PER_UNPLANNED_DELAY_DAY
 
+_NO_DELAY = timedelta(days=0)
+
 
 def number_of_delayed_cars(vehicle_assignments: list[VehicleAssignment]) -> int:
     """
@@ -14,7 +17,7 @@ def number_of_delayed_cars(vehicle_assignments: list[VehicleAssignment]) -> int:
     Returns:
         int: The number of vehicles that are delayed.
     """
-    return sum(1 for va in vehicle_assignments if va.delayed_by > timedelta(days=0))
+    return sum(1 for va in vehicle_assignments if va.delayed_by > _NO_DELAY)
 
 
 def number_of_planned_delayed_cars(vehicle_assignments: list[VehicleAssignment]) -> int:
@@ -40,7 +43,7 @@ def number_of_planned_delayed_cars_which_are_delayed(vehicle_assignments: list[V
     Returns:
         int: The number of vehicles that are planned to be delayed and are actually delayed.
     """
-    return sum(1 for va in vehicle_assignments if va.planned_delayed and va.delayed_by > timedelta(days=0))
+    return sum(1 for va in vehicle_assignments if va.planned_delayed and va.delayed_by > _NO_DELAY)
 
 
 def number_of_vehicles_transported_in_trucks_which_are_not_free(trucks: dict[TruckIdentifier, Truck],
@@ -56,7 +59,7 @@ def number_of_vehicles_transported_in_trucks_which_are_not_free(trucks: dict[Tru
     Returns:
         int: The number of vehicles that are transported in trucks which are not free.
     """
-    return sum(len(ta.load) for ti, ta in truck_assignments.items() if len(ta.load) > 0 and trucks[ti].price > 0)
+    return sum(load_size for _, load_size in _loaded_trucks_which_are_not_free(trucks, truck_assignments))
 
 
 def delay_price(vehicle_assignment: VehicleAssignment) -> int:
@@ -75,6 +78,70 @@ def delay_price(vehicle_assignment: VehicleAssignment) -> int:
         return FIXED_UNPLANNED_DELAY_COST + vehicle_assignment.delayed_by.days * COST_PER_UNPLANNED_DELAY_DAY
 
 
+class VehicleMetrics(NamedTuple):
+    """
+    The metrics of a solution which only depend on the vehicle assignments.
+
+    Attributes:
+        number_of_delayed_cars (int): The number of vehicles that are delayed.
+        number_of_planned_delayed_cars (int): The number of vehicles that are planned to be delayed.
+        number_of_planned_delayed_cars_which_are_delayed (int): The number of vehicles that are planned to be delayed
+            and are actually delayed.
+        fixed_planned_delay_cost (int): Fixed cost for planned delays.
+        summed_day_planned_delay_cost (int): Summed day cost for planned delays.
+        fixed_unplanned_delay_cost (int): Fixed cost for unplanned delays.
+        summed_day_unplanned_delay_cost (int): Summed day cost for unplanned delays.
+        total_delay_cost (int): Total delay cost.
+    """
+    number_of_delayed_cars: int
+    number_of_planned_delayed_cars: int
+    number_of_planned_delayed_cars_which_are_delayed: int
+    fixed_planned_delay_cost: int
+    summed_day_planned_delay_cost: int
+    fixed_unplanned_delay_cost: int
+    summed_day_unplanned_delay_cost: int
+    total_delay_cost: int
+
+
+def compute_vehicle_metrics(vehicle_assignments: list[VehicleAssignment]) -> VehicleMetrics:
+    """
+    Calculates the delay counts and costs of the vehicle assignments in a single pass.
+
+    Args:
+        vehicle_assignments (list[VehicleAssignment]): A list of vehicle assignments.
+
+    Returns:
+        VehicleMetrics: The delay counts and costs of the vehicle assignments.
+    """
+    num_delayed_cars = 0
+    num_planned_delayed_cars = 0
+    num_planned_delayed_cars_which_are_delayed = 0
+    fixed_planned_delay_cost = 0
+    fixed_unplanned_delay_cost = 0
+    summed_day_planned_delay_cost = 0
+    summed_day_unplanned_delay_cost = 0
+    for va in vehicle_assignments:
+        is_delayed = va.delayed_by > _NO_DELAY
+        if is_delayed:
+            num_delayed_cars += 1
+        if va.planned_delayed:
+            num_planned_delayed_cars += 1
+            # The fixed cost for planned delays is paid even if the vehicle is not actually delayed
+            fixed_planned_delay_cost += FIXED_PLANNED_DELAY_COST
+            if is_delayed:
+                num_planned_delayed_cars_which_are_delayed += 1
+                summed_day_planned_delay_cost += va.delayed_by.days * COST_PER_PLANNED_DELAY_DAY
+        elif is_delayed:
+            fixed_unplanned_delay_cost += FIXED_UNPLANNED_DELAY_COST
+            summed_day_unplanned_delay_cost += va.delayed_by.days * COST_PER_UNPLANNED_DELAY_DAY
+
+    total_delay_cost = fixed_planned_delay_cost + fixed_unplanned_delay_cost + summed_day_planned_delay_cost + summed_day_unplanned_delay_cost
+
+    return VehicleMetrics(num_delayed_cars, num_planned_delayed_cars, num_planned_delayed_cars_which_are_delayed,
+                          fixed_planned_delay_cost, summed_day_planned_delay_cost, fixed_unplanned_delay_cost,
+                          summed_day_unplanned_delay_cost, total_delay_cost)
+
+
 def price_paid_for_delays(vehicle_assignments: list[VehicleAssignment]) -> tuple[int, int, int, int, int]:
     """
     Calculates the total prices paid for delays based on the vehicle assignments.
@@ -90,14 +157,10 @@ def price_paid_for_delays(vehicle_assignments: list[VehicleAssignment]) -> tuple
             - Summed day cost for unplanned delays
             - Total delay cost
     """
-    fixed_planned_delay_cost = sum(FIXED_PLANNED_DELAY_COST for va in vehicle_assignments if va.planned_delayed)
-    fixed_unplanned_delay_cost = sum(FIXED_UNPLANNED_DELAY_COST for va in vehicle_assignments if not va.planned_delayed and va.delayed_by > timedelta(days=0))
-    summed_day_planned_delay_cost = sum(va.delayed_by.days * COST_PER_PLANNED_DELAY_DAY for va in vehicle_assignments if va.planned_delayed and va.delayed_by > timedelta(days=0))
-    summed_day_unplanned_delay_cost = sum(va.delayed_by.days * COST_PER_UNPLANNED_DELAY_DAY for va in vehicle_assignments if not va.planned_delayed and va.delayed_by > timedelta(days=0))
+    metrics = compute_vehicle_metrics(vehicle_assignments)
+    return (metrics.fixed_planned_delay_cost, metrics.summed_day_planned_delay_cost, metrics.fixed_unplanned_delay_cost,
+            metrics.summed_day_unplanned_delay_cost, metrics.total_delay_cost)
 
-    total_delay_cost = fixed_planned_delay_cost + fixed_unplanned_delay_cost + summed_day_planned_delay_cost + summed_day_unplanned_delay_cost
-
-    return fixed_planned_delay_cost, summed_day_planned_delay_cost, fixed_unplanned_delay_cost, summed_day_unplanned_delay_cost, total_delay_cost
 
 def price_paid_for_trucks(trucks: dict[TruckIdentifier, Truck],
                           truck_assignments: dict[TruckIdentifier, TruckAssignment]) -> float:
@@ -111,8 +174,23 @@ def price_paid_for_trucks(trucks: dict[TruckIdentifier, Truck],
     Returns:
         float: The total price paid for trucks.
     """
-    return sum(trucks[ti].price / trucks[ti].capacity * len(ta.load) for ti, ta in truck_assignments.items() if
-               len(ta.load) > 0 and trucks[ti].price > 0)
+    return sum(truck.price / truck.capacity * load_size for truck, load_size in
+               _loaded_trucks_which_are_not_free(trucks, truck_assignments))
+
+
+def _loaded_trucks_which_are_not_free(trucks: dict[TruckIdentifier, Truck],
+                                      truck_assignments: dict[TruckIdentifier, TruckAssignment]) \
+        -> Iterator[tuple[Truck, int]]:
+    """
+    Yields each truck which is not free and has a non-empty load together with the size of its load, in the order of
+    the truck assignments. Each truck is looked up only once.
+    """
+    for ti, ta in truck_assignments.items():
+        load_size = len(ta.load)
+        if load_size > 0:
+            truck = trucks[ti]
+            if truck.price > 0:
+                yield truck, load_size
 
 
 def get_pretty_metrics(trucks: dict[TruckIdentifier, Truck], truck_assignments: dict[TruckIdentifier, TruckAssignment],
@@ -124,11 +202,11 @@ def get_pretty_metrics(trucks: dict[TruckIdentifier, Truck], truck_assignments:
         str: A formatted string containing the metrics.
     """
     message_length = 65
-    num_delayed_cars = number_of_delayed_cars(vehicle_assignments)
-    num_planned_delay_cars = number_of_planned_delayed_cars(vehicle_assignments)
-    num_actual_planned_delay_cars = number_of_planned_delayed_cars_which_are_delayed(vehicle_assignments)
+    # All vehicle metrics are computed in a single pass over the vehicle assignments
+    (num_delayed_cars, num_planned_delay_cars, num_actual_planned_delay_cars, fixed_planned_delay_cost,
+     summed_day_planned_delay_cost, fixed_unplanned_delay_cost, summed_day_unplanned_delay_cost,
+     total_delay_cost) = compute_vehicle_metrics(vehicle_assignments)
     num_not_free_trucks = number_of_vehicles_transported_in_trucks_which_are_not_free(trucks, truck_assignments)
-    fixed_planned_delay_cost, summed_day_planned_delay_cost, fixed_unplanned_delay_cost, summed_day_unplanned_delay_cost, total_delay_cost = price_paid_for_delays(vehicle_assignments)
     price_paid_trucks = price_paid_for_trucks(trucks, truck_assignments)
     res = ("Metrics:\n" +
            "Number of delayed cars:".ljust(message_length) + f"{num_delayed_cars}\n" +
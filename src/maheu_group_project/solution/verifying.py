@@ -1,8 +1,13 @@
 from datetime import timedelta
 from enum import Enum
+from itertools import pairwise
 
 from maheu_group_project.solution.encoding import VehicleAssignment, TruckIdentifier, Truck, TruckAssignment, Vehicle
 
+_NO_DELAY = timedelta(0)
+# The obligatory rest day a vehicle has to spend at a location before it can depart with the next truck
+_ONE_DAY = timedelta(1)
+
 
 class VerifyVehiclePathResult(Enum):
     """
@@ -13,7 +18,8 @@ class VerifyVehiclePathResult(Enum):
 
 
 def verify_vehicle_path(vehicle: Vehicle, vehicle_assignment: VehicleAssignment, trucks: dict[TruckIdentifier, Truck],
-                        truck_assignments: dict[TruckIdentifier, TruckAssignment]) -> VerifyVehiclePathResult:
+                        truck_assignments: dict[TruckIdentifier, TruckAssignment],
+                        quiet: bool = False) -> VerifyVehiclePathResult:
     """
     Tests if a vehicle path is valid.
 
@@ -29,6 +35,7 @@ def verify_vehicle_path(vehicle: Vehicle, vehicle_assignment: VehicleAssignment,
         trucks (dict[TruckIdentifier, Truck]): Dictionary of trucks available for transportation.
         truck_assignments (dict[TruckIdentifier, TruckAssignment]): Dictionary mapping truck identifiers to their
             assignments.
+        quiet (bool): Whether to skip printing why the vehicle did not reach its destination. Defaults to False.
 
     Returns:
         - VerifyVehiclePathResult.VALID if the path is valid.
@@ -40,7 +47,8 @@ def verify_vehicle_path(vehicle: Vehicle, vehicle_assignment: VehicleAssignment,
 
     # Check if the vehicle actually took any trucks
     if len(vehicle_path) == 0:
-        print(f"The vehicle {vehicle_assignment.id} has no trucks assigned.")
+        if not quiet:
+            print(f"The vehicle {vehicle_assignment.id} has no trucks assigned.")
         return VerifyVehiclePathResult.NOT_REACHED_DESTINATION
 
     # Check if the first truck in the path starts at the vehicle's origin, departs after the vehicle is available
@@ -59,12 +67,12 @@ def verify_vehicle_path(vehicle: Vehicle, vehicle_assignment: VehicleAssignment,
 
     # For each truck in the path, check if it departs earliest one day after the previous truck arrives,
     # starts at the end location of the previous truck, and the vehicle is part of the truck's load
-    for current_truck_id in vehicle_path[1:]:
+    for previous_truck_id, current_truck_id in pairwise(vehicle_path):
         current_truck = trucks[current_truck_id]
         current_truck_assignment = truck_assignments[current_truck_id]
-        previous_truck = trucks[vehicle_path[vehicle_path.index(current_truck_id) - 1]]
+        previous_truck = trucks[previous_truck_id]
         # Check the departure date
-        if not (current_truck.departure_date >= previous_truck.arrival_date + timedelta(1)):
+        if not (current_truck.departure_date >= previous_truck.arrival_date + _ONE_DAY):
             assert False, f"In delivering of vehicle {vehicle_assignment.id}, the truck with ID {current_truck_id} departs too early. That is, the vehicle departs on the same day it arrives and does not respect the obligatory rest-day 💪"
         # Check locations
         if not (current_truck.start_location == previous_truck.end_location):
@@ -76,33 +84,37 @@ def verify_vehicle_path(vehicle: Vehicle, vehicle_assignment: VehicleAssignment,
     # Check if the last truck in the path ends at the vehicle's destination
     last_truck = trucks[vehicle_path[-1]]
     if not (last_truck.end_location == vehicle.destination):
-        print(
-            f"The truck with ID {vehicle_path[-1]} needs to end at destination of vehicle {vehicle_assignment.id}, but it doesn't.")
+        if not quiet:
+            print(
+                f"The truck with ID {vehicle_path[-1]} needs to end at destination of vehicle {vehicle_assignment.id}, but it doesn't.")
         return VerifyVehiclePathResult.NOT_REACHED_DESTINATION
 
     # Check delay information
-    if not (vehicle_assignment.delayed_by >= timedelta(0)):
+    if not (vehicle_assignment.delayed_by >= _NO_DELAY):
         assert False, f"The vehicle {vehicle_assignment.id} has a negative delay."
     # Check if the last truck's arrival date is consistent with the vehicle's due date and delay information
-    if last_truck.arrival_date > vehicle.due_date:
+    actual_delay = last_truck.arrival_date - vehicle.due_date
+    if actual_delay > _NO_DELAY:
         # The vehicle is delayed, check if this is consistent with the assignment data
-        if vehicle_assignment.delayed_by == timedelta(0):
-            assert False, f"The vehicle {vehicle_assignment.id} is actually delayed: {(last_truck.arrival_date - vehicle.due_date).days} days, but this is not consistent with the vehicle assignment: {vehicle_assignment}."
+        if vehicle_assignment.delayed_by == _NO_DELAY:
+            assert False, f"The vehicle {vehicle_assignment.id} is actually delayed: {actual_delay.days} days, but this is not consistent with the vehicle assignment: {vehicle_assignment}."
         else:
-            if last_truck.arrival_date != vehicle.due_date + vehicle_assignment.delayed_by:
-                assert False, f"Delay information for vehicle {vehicle_assignment.id}: {vehicle_assignment.delayed_by.days} days is inconsistent with actual arrival delay of: {(last_truck.arrival_date - vehicle.due_date).days} days"
+            # Only whole days count, since adding the delay to the due date would ignore any fraction of a day as well
+            if actual_delay.days != vehicle_assignment.delayed_by.days:
+                assert False, f"Delay information for vehicle {vehicle_assignment.id}: {vehicle_assignment.delayed_by.days} days is inconsistent with actual arrival delay of: {actual_delay.days} days"
     return VerifyVehiclePathResult.VALID
 
 
 def verify_truck_load(truck: Truck, truck_assignment: TruckAssignment,
-                      vehicle_assignments: list[VehicleAssignment]) -> bool:
+                      truck_ids_by_vehicle_id: dict[int, set[TruckIdentifier]]) -> bool:
     """
     Verifies that the load on the truck does not exceed its capacity and is consistent with the vehicles assigned to it.
 
     Args:
         truck (Truck): The truck to verify.
         truck_assignment (TruckAssignment): The assignment of the truck to verify.
-        vehicle_assignments (list[VehicleAssignment]): The list of vehicles assigned to the solution.
+        truck_ids_by_vehicle_id (dict[int, set[TruckIdentifier]]): For each vehicle of the solution, the set of
+            trucks in its paths_taken.
 
     Returns:
         bool: True if the truck's load is valid, False otherwise.
@@ -116,16 +128,16 @@ def verify_truck_load(truck: Truck, truck_assignment: TruckAssignment,
         assert False, f"The truck with ID {truck_id} has a load of {total_load}, which exceeds its capacity of {truck.capacity}."
 
     # For each vehicle in the truck's load, check if the truck is actually used in the vehicle's paths_taken
-    for vehicle in vehicle_assignments:
-        if vehicle.id in truck_assignment.load:
-            if truck_id not in vehicle.paths_taken:
-                assert False, f"The vehicle {vehicle.id} does not use the truck with ID {truck_id}, but it is part of the truck's load."
+    for vehicle_id in truck_assignment.load:
+        truck_ids_of_vehicle = truck_ids_by_vehicle_id.get(vehicle_id)
+        if truck_ids_of_vehicle is not None and truck_id not in truck_ids_of_vehicle:
+            assert False, f"The vehicle {vehicle_id} does not use the truck with ID {truck_id}, but it is part of the truck's load."
     return True
 
 
 def verify_solution(vehicles: list[Vehicle], vehicle_assignments: list[VehicleAssignment],
                     trucks: dict[TruckIdentifier, Truck],
-                    truck_assignments: dict[TruckIdentifier, TruckAssignment]) -> bool | int:
+                    truck_assignments: dict[TruckIdentifier, TruckAssignment], quiet: bool = False) -> bool | int:
     """
     Verifies if a given assignment of trucks and vehicles is valid.
 
@@ -134,6 +146,7 @@ def verify_solution(vehicles: list[Vehicle], vehicle_assignments: list[VehicleAs
         vehicle_assignments (list[VehicleAssignment]): List containing assignments of the vehicles.
         trucks (dict[TruckIdentifier, Truck]): Dictionary of all trucks.
         truck_assignments (dict[TruckIdentifier, TruckAssignment]): Dictionary containing the assignments of the truck
+        quiet (bool): Whether to skip printing which vehicles did not reach their destination. Defaults to False.
 
     Returns:
         int: If the solution is valid, but some vehicles did not reach their destination, returns the number of such vehicles.
@@ -142,21 +155,24 @@ def verify_solution(vehicles: list[Vehicle], vehicle_assignments: list[VehicleAs
     # Check if every vehicle uses a valid path
     number_of_vehicles_which_did_not_reach_destination: int = 0
     for i in range(len(vehicle_assignments)):
-        vehicle_path_is_valid = verify_vehicle_path(vehicles[i], vehicle_assignments[i], trucks, truck_assignments)
-        match vehicle_path_is_valid:
-            case VerifyVehiclePathResult.NOT_REACHED_DESTINATION:
-                number_of_vehicles_which_did_not_reach_destination += 1
+        vehicle_path_is_valid = verify_vehicle_path(vehicles[i], vehicle_assignments[i], trucks, truck_assignments,
+                                                    quiet=quiet)
+        # Enum members are singletons, so they can be compared by identity
+        if vehicle_path_is_valid is VerifyVehiclePathResult.NOT_REACHED_DESTINATION:
+            number_of_vehicles_which_did_not_reach_destination += 1
 
     # Check if every truck has a valid load
+    truck_ids_by_vehicle_id = {va.id: set(va.paths_taken) for va in vehicle_assignments}
     for truck_id in trucks.keys():
         if truck_id not in truck_assignments:
             assert False, f"Truck {truck_id} is not contained in the truck assignments."
         else:
-            if not verify_truck_load(trucks[truck_id], truck_assignments[truck_id], vehicle_assignments):
+            if not verify_truck_load(trucks[truck_id], truck_assignments[truck_id], truck_ids_by_vehicle_id):
                 assert False, f"Truck {truck_id} has an invalid load."
     if number_of_vehicles_which_did_not_reach_destination > 0:
         # Return number_of_cars_which_did_not_reach_destination to indicate that the solution is valid, but some vehicles have not reached their destination
-        print(f"{number_of_vehicles_which_did_not_reach_destination} vehicles did not reach their destination.")
+        if not quiet:
+            print(f"{number_of_vehicles_which_did_not_reach_destination} vehicles did not reach their destination.")
         return number_of_vehicles_which_did_not_reach_destination
     else:
         return True
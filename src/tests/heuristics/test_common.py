@@ -0,0 +1,28 @@
+from datetime import date
+
+from maheu_group_project.heuristics.common import find_unreachable_vehicles
+from maheu_group_project.solution.encoding import Truck, Vehicle, location_from_string
+
+
+def test_find_unreachable_vehicles():
+    plant = location_from_string("GER01PLANT")
+    terminal = location_from_string("GER02TERM")
+    dealer = location_from_string("FRA01DEAL")
+    trucks = [
+        # The truck to the dealer departs one day after the first truck arrives at the terminal, which respects the
+        # obligatory rest day
+        Truck(plant, terminal, date(2025, 1, 1), date(2025, 1, 2), 1, 5, 100),
+        Truck(terminal, dealer, date(2025, 1, 3), date(2025, 1, 4), 1, 5, 100),
+        # Arrives at the terminal on the day the truck to the dealer departs, so the vehicle cannot take it
+        Truck(plant, terminal, date(2025, 1, 3), date(2025, 1, 3), 2, 5, 100),
+    ]
+    vehicles = [
+        Vehicle(0, plant, dealer, date(2025, 1, 1), date(2025, 1, 5)),
+        # Available only after the first truck has left the plant, and a same-day transfer violates the rest day
+        Vehicle(1, plant, dealer, date(2025, 1, 2), date(2025, 1, 5)),
+        Vehicle(2, terminal, dealer, date(2025, 1, 1), date(2025, 1, 5)),
+        # No truck ever leaves the dealer
+        Vehicle(3, dealer, terminal, date(2025, 1, 1), date(2025, 1, 5)),
+    ]
+
+    assert find_unreachable_vehicles(vehicles, {truck.get_identifier(): truck for truck in trucks}) == [1, 3]
@@ -0,0 +1,51 @@
+from datetime import date
+
+from maheu_group_project import parsing
+from maheu_group_project.heuristics.flow import solve_deterministically, solve_in_real_time
+from maheu_group_project.heuristics.solver import SolverContext, SolverType, _DETERMINISTIC_SOLVERS, _get_runner, \
+    _solve, solve_real_time
+from maheu_group_project.solution.encoding import Truck, Vehicle, location_from_string
+from maheu_group_project.solution.verifying import verify_solution
+
+
+def test_solve_real_time_uses_real_time_flow_solver(monkeypatch):
+    # The test must not leave cache files in the data directory
+    monkeypatch.setattr(parsing, "USE_DISK_CACHE", False)
+    calls = []
+
+    def fake_solve_flow_in_real_time(*args, **kwargs):
+        calls.append(args)
+        return [], {}
+
+    def fail_solve_flow_deterministically(*args, **kwargs):
+        raise AssertionError("solve_real_time must not use the deterministic flow solver")
+
+    monkeypatch.setattr(solve_in_real_time, "solve_flow_in_real_time", fake_solve_flow_in_real_time)
+    monkeypatch.setattr(solve_deterministically, "solve_flow_deterministically", fail_solve_flow_deterministically)
+
+    vehicle_assignments, truck_assignments = solve_real_time(SolverType.FLOW, "CaseMaHeu25_01",
+                                                             "realised_capacity_data_001.csv")
+
+    assert (vehicle_assignments, truck_assignments) == ([], {})
+    assert len(calls) == 1
+
+
+def test_flow_solver_assigns_no_trucks_to_unreachable_vehicles():
+    plant, other_plant, dealer = (location_from_string("GER01PLANT"), location_from_string("GER02PLANT"),
+                                  location_from_string("FRA01DEAL"))
+    trucks = [Truck(plant, dealer, date(2025, 1, day), date(2025, 1, day + 1), 1, 10, 100) for day in (1, 3)]
+    trucks_realised = {truck.get_identifier(): truck for truck in trucks}
+    # No truck departs from other_plant, so vehicle 1 cannot reach its destination
+    vehicles = [Vehicle(0, plant, dealer, date(2025, 1, 1), date(2025, 1, 5)),
+                Vehicle(1, other_plant, dealer, date(2025, 1, 1), date(2025, 1, 5)),
+                Vehicle(2, plant, dealer, date(2025, 1, 2), date(2025, 1, 5))]
+    context = SolverContext("CaseMaHeu25_01", [plant, other_plant, dealer], vehicles, trucks_realised, {})
+
+    result = _solve(_get_runner(_DETERMINISTIC_SOLVERS, SolverType.FLOW), context)
+
+    assert [vehicle_assignment.id for vehicle_assignment in result.vehicle_assignments] == [0, 1, 2]
+    assert result.vehicle_assignments[1].paths_taken == []
+    assert verify_solution(vehicles, result.vehicle_assignments, trucks_realised, result.truck_assignments,
+                           quiet=True) == 1
+    assert sorted(result.truck_assignments[trucks[0].get_identifier()].load
+                  + result.truck_assignments[trucks[1].get_identifier()].load) == [0, 2]
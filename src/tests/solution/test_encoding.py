@@ -0,0 +1,15 @@
+import pickle
+from datetime import date
+
+from maheu_group_project.solution.encoding import TruckIdentifier, location_from_string
+
+
+def test_truck_identifier_hash_survives_pickling():
+    truck_id = TruckIdentifier(location_from_string("GER01PLANT"), location_from_string("BEL01TERM"), 11,
+                               date(2025, 6, 27))
+
+    unpickled_truck_id = pickle.loads(pickle.dumps(truck_id))
+
+    assert unpickled_truck_id == truck_id
+    assert hash(unpickled_truck_id) == hash(truck_id)
+    assert {truck_id: 1}[unpickled_truck_id] == 1
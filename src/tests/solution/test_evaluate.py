@@ -0,0 +1,21 @@
+from datetime import date
+
+from maheu_group_project.solution.encoding import Truck, TruckAssignment, Vehicle, VehicleAssignment, \
+    location_from_string
+from maheu_group_project.solution.evaluate import remove_horizon_keep_used_trucks
+
+
+def test_remove_horizon_keep_used_trucks_removes_all_filtered_vehicles_from_loads():
+    plant, dealer = location_from_string("GER01PLANT"), location_from_string("FRA01DEAL")
+    vehicles = [Vehicle(vehicle_id, plant, dealer, date(2025, 6, 1 + vehicle_id), date(2025, 6, 20))
+                for vehicle_id in range(4)]
+    truck = Truck(plant, dealer, date(2025, 6, 5), date(2025, 6, 6), 1, 10, 100)
+    vehicle_assignments = [VehicleAssignment(vehicle.id, [truck.get_identifier()]) for vehicle in vehicles]
+    truck_assignments = {truck.get_identifier(): TruckAssignment([0, 1, 2, 3])}
+
+    # Vehicles 0 and 1 become available within the front horizon and are hence removed
+    vehicle_assignments, truck_assignments = remove_horizon_keep_used_trucks(
+        vehicle_assignments, vehicles, truck_assignments, {truck.get_identifier(): truck}, {}, front_horizon=2)
+
+    assert [va.id for va in vehicle_assignments] == [2, 3]
+    assert truck_assignments[truck.get_identifier()].load == [2, 3]
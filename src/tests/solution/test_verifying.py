@@ -0,0 +1,16 @@
+from datetime import date
+
+import pytest
+
+from maheu_group_project.solution.encoding import Truck, TruckAssignment, location_from_string
+from maheu_group_project.solution.verifying import verify_truck_load
+
+
+def test_verify_truck_load_detects_vehicles_not_using_the_truck():
+    truck = Truck(location_from_string("GER01PLANT"), location_from_string("FRA01DEAL"), date(2025, 6, 5),
+                  date(2025, 6, 6), 1, 10, 100)
+    truck_ids_by_vehicle_id = {0: {truck.get_identifier()}, 1: set()}
+
+    assert verify_truck_load(truck, TruckAssignment([0]), truck_ids_by_vehicle_id)
+    with pytest.raises(AssertionError):
+        verify_truck_load(truck, TruckAssignment([0, 1]), truck_ids_by_vehicle_id)
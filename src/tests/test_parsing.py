@@ -0,0 +1,20 @@
+import pickle
+
+from maheu_group_project import parsing
+
+
+def test_disk_cache_referencing_missing_module_is_a_miss(tmp_path, monkeypatch):
+    monkeypatch.setattr(parsing, "USE_DISK_CACHE", True)
+    source_file = tmp_path / "vehicle_data.csv"
+    source_file.write_text("")
+    cache_file = tmp_path / "vehicle_data.csv.pickle"
+    with open(cache_file, "wb") as file:
+        pickle.dump(parsing._disk_cache_key([source_file]), file)
+        # A pickled reference to a class whose module does not exist (anymore)
+        file.write(b"cmodule_which_does_not_exist\nRemovedClass\n.")
+
+    assert parsing._load_from_disk_cache(cache_file, [source_file]) is None
+
+    parsing._store_in_disk_cache(cache_file, [source_file], ["parsed data"])
+
+    assert parsing._load_from_disk_cache(cache_file, [source_file]) == ["parsed data"]
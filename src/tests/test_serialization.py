@@ -0,0 +1,30 @@
+import json
+from datetime import date
+
+from maheu_group_project.serialization import serialize_truck_assignments, deserialize_truck_assignments
+from maheu_group_project.solution.encoding import TruckAssignment, TruckIdentifier, location_from_string
+
+
+def test_truck_assignments_round_trip(tmp_path):
+    truck_assignments = {
+        TruckIdentifier(location_from_string("GER01PLANT"), location_from_string("BEL01TERM"), 11,
+                        date(2025, 6, 27)): TruckAssignment([3, 1]),
+        TruckIdentifier(location_from_string("BEL01TERM"), location_from_string("FRA01DEAL"), 2,
+                        date(2025, 6, 28)): TruckAssignment(),
+    }
+    file_path = tmp_path / "trucks.json"
+
+    serialize_truck_assignments(truck_assignments, str(file_path))
+
+    assert deserialize_truck_assignments(str(file_path)) == truck_assignments
+
+
+def test_deserialize_truck_assignments_in_old_format(tmp_path):
+    truck_key = json.dumps({"departure_date": "2025-06-27", "end_location": {"name": "BEL01", "type": "TERM"},
+                            "start_location": {"name": "GER01", "type": "PLANT"}, "truck_number": 11}, sort_keys=True)
+    file_path = tmp_path / "trucks.json"
+    file_path.write_text(json.dumps({truck_key: {"load": [3, 1]}}))
+
+    truck_id = TruckIdentifier(location_from_string("GER01PLANT"), location_from_string("BEL01TERM"), 11,
+                               date(2025, 6, 27))
+    assert deserialize_truck_assignments(str(file_path)) == {truck_id: TruckAssignment([3, 1])}